@@ -9,7 +9,40 @@ from __future__ import annotations
 
 from typing import Optional, Sequence
 
-from femora.core.pattern_base import Pattern
+import numpy as np
+
+from femora.core.pattern_base import Pattern, _as_float, _as_int
+
+_TRANSFORM_KEYS = ("T00", "T01", "T02", "T10", "T11", "T12", "T20", "T21", "T22")
+_ORIGIN_KEYS = ("x00", "x01", "x02")
+_TRANSFORM_KEY_SET = frozenset(_TRANSFORM_KEYS)
+_ORIGIN_KEY_SET = frozenset(_ORIGIN_KEYS)
+
+
+def _coerce_float_array(values: Sequence[float], name: str, size: int) -> np.ndarray:
+    """Convert ``values`` to a contiguous ``float64`` array in one NumPy cast.
+
+    Args:
+        values: Numeric sequence or array to convert.
+        name: Parameter name used in error messages.
+        size: Required number of entries.
+
+    Returns:
+        np.ndarray: C-contiguous ``float64`` array with ``size`` entries.
+
+    Raises:
+        ValueError: If any entry is non-numeric or non-finite (``None`` casts to
+            NaN), or the number of entries differs from ``size``.
+    """
+    try:
+        array = np.ascontiguousarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} values must be numeric") from None
+    if array.size != size:
+        raise ValueError(f"{name} must contain {size} values")
+    if not np.isfinite(array).all():
+        raise ValueError(f"{name} values must be finite numbers")
+    return array
 
 
 class H5DRMPattern(Pattern):
@@ -49,6 +82,16 @@ class H5DRMPattern(Pattern):
         "members": ["__init__"],
     }
 
+    __slots__ = (
+        "filepath",
+        "factor",
+        "crd_scale",
+        "distance_tolerance",
+        "do_coordinate_transformation",
+        "_transform_matrix",
+        "_origin",
+    )
+
     def __init__(
         self,
         filepath: str,
@@ -62,45 +105,72 @@ class H5DRMPattern(Pattern):
     ):
         """Create an H5DRM pattern with coordinate mapping parameters.
 
+        The matrix and origin are stored as contiguous ``float64`` arrays of shape
+        ``(9,)`` (row-major) and ``(3,)``, so ``transform_matrix[i]`` is still the
+        i-th matrix entry. Coordinate transforms can take a view with
+        ``pattern.transform_matrix.reshape(3, 3)``.
+
         Args:
             filepath: Path to the H5DRM dataset file.
             factor: Scale factor applied to DRM forces and displacements.
             crd_scale: Coordinate scale factor for the dataset.
             distance_tolerance: Tolerance used to match DRM dataset points to mesh nodes.
             do_coordinate_transformation: Flag (0 or 1) controlling coordinate transformation.
-            transform_matrix: Optional 9-value sequence representing a 3x3 transformation matrix.
-                If not supplied, T00 through T22 must be present in kwargs.
+            transform_matrix: Optional 9-value sequence (row-major) or 3x3 array representing the
+                transformation matrix. If not supplied, T00 through T22 must be present in kwargs.
             origin: Optional 3-value sequence representing the transformed origin coordinate.
                 If not supplied, x00 through x02 must be present in kwargs.
             **kwargs: Compatibility support for individual matrix or origin entries.
 
         Raises:
-            ValueError: If do_coordinate_transformation is not 0 or 1, or if
-                transform_matrix or origin sequences have invalid lengths.
+            ValueError: If a scalar parameter is not numeric, if
+                do_coordinate_transformation is not 0 or 1, or if
+                transform_matrix or origin contain non-numeric values or have
+                invalid lengths.
             KeyError: If required individual matrix/origin keys are missing from kwargs when not using sequences.
         """
         super().__init__("H5DRM")
         self.filepath = str(filepath)
-        self.factor = float(factor)
-        self.crd_scale = float(crd_scale)
-        self.distance_tolerance = float(distance_tolerance)
-        self.do_coordinate_transformation = int(do_coordinate_transformation)
+        self.factor = _as_float(factor, "factor")
+        self.crd_scale = _as_float(crd_scale, "crd_scale")
+        self.distance_tolerance = _as_float(distance_tolerance, "distance_tolerance")
+        self.do_coordinate_transformation = _as_int(
+            do_coordinate_transformation, "do_coordinate_transformation"
+        )
         if self.do_coordinate_transformation not in (0, 1):
             raise ValueError("do_coordinate_transformation must be 0 or 1")
 
         if transform_matrix is None:
-            keys = ("T00", "T01", "T02", "T10", "T11", "T12", "T20", "T21", "T22")
-            transform_matrix = [kwargs[key] for key in keys]
-        self.transform_matrix = [float(value) for value in transform_matrix]
-        if len(self.transform_matrix) != 9:
-            raise ValueError("transform_matrix must contain 9 values")
+            missing = _TRANSFORM_KEY_SET - kwargs.keys()
+            if missing:
+                raise KeyError(f"Missing transform_matrix entries: {sorted(missing)}")
+            transform_matrix = [kwargs[key] for key in _TRANSFORM_KEYS]
+        self.transform_matrix = transform_matrix
 
         if origin is None:
-            keys = ("x00", "x01", "x02")
-            origin = [kwargs[key] for key in keys]
-        self.origin = [float(value) for value in origin]
-        if len(self.origin) != 3:
-            raise ValueError("origin must contain 3 values")
+            missing = _ORIGIN_KEY_SET - kwargs.keys()
+            if missing:
+                raise KeyError(f"Missing origin entries: {sorted(missing)}")
+            origin = [kwargs[key] for key in _ORIGIN_KEYS]
+        self.origin = origin
+
+    @property
+    def transform_matrix(self) -> np.ndarray:
+        """Row-major coordinate transformation matrix as a ``(9,)`` ``float64`` array."""
+        return self._transform_matrix
+
+    @transform_matrix.setter
+    def transform_matrix(self, values: Sequence[float]) -> None:
+        self._transform_matrix = _coerce_float_array(values, "transform_matrix", 9).reshape(9)
+
+    @property
+    def origin(self) -> np.ndarray:
+        """Transformed origin coordinate as a ``(3,)`` ``float64`` array."""
+        return self._origin
+
+    @origin.setter
+    def origin(self, values: Sequence[float]) -> None:
+        self._origin = _coerce_float_array(values, "origin", 3).reshape(3)
 
     def to_tcl(self) -> str:
         """Render this pattern as an OpenSees Tcl command.
@@ -111,10 +181,26 @@ class H5DRMPattern(Pattern):
         Raises:
             ValueError: If the pattern has not been assigned a manager tag.
         """
-        matrix = " ".join(map(str, self.transform_matrix))
-        origin = " ".join(map(str, self.origin))
-        return (
-            f'pattern H5DRM {self._require_tag()} "{self.filepath}" '
+        tag = self._require_tag()
+        key = (
+            tag,
+            self.filepath,
+            self.factor,
+            self.crd_scale,
+            self.distance_tolerance,
+            self.do_coordinate_transformation,
+            self._transform_matrix.tobytes(),
+            self._origin.tobytes(),
+        )
+        cache = self._tcl_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        coordinates = np.concatenate((self._transform_matrix, self._origin))
+        mapping = " ".join(map(str, coordinates.tolist()))
+        tcl = (
+            f'pattern H5DRM {tag} "{self.filepath}" '
             f"{self.factor} {self.crd_scale} {self.distance_tolerance} "
-            f"{self.do_coordinate_transformation} {matrix} {origin}"
+            f"{self.do_coordinate_transformation} {mapping}"
         )
+        self._tcl_cache = (key, tcl)
+        return tcl
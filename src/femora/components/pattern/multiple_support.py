@@ -45,6 +45,8 @@ class ImposedMotion:
         "members": ["__init__"],
     }
 
+    __slots__ = ("node_tag", "dof", "ground_motion")
+
     def __init__(self, node_tag: int, dof: int, ground_motion: GroundMotion):
         """Create an imposed support motion constraint.
 
@@ -122,6 +124,8 @@ class MultipleSupportPattern(Pattern):
         ],
     }
 
+    __slots__ = ("_imposed_motions",)
+
     def __init__(self):
         """Create an empty multiple-support excitation pattern."""
         super().__init__("MultipleSupport")
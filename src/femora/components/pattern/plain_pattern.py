@@ -7,13 +7,15 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from femora.core.load_base import Load
-from femora.core.load_manager import LoadManager
-from femora.core.pattern_base import Pattern
+from femora.core.pattern_base import Pattern, _as_float
 from femora.core.time_series_base import TimeSeries
 
+if TYPE_CHECKING:
+    from femora.core.load_manager import LoadManager
+
 
 class PlainPattern(Pattern):
     """OpenSees Plain load pattern with attached load entities.
@@ -55,6 +57,8 @@ class PlainPattern(Pattern):
         ],
     }
 
+    __slots__ = ("time_series", "factor", "_loads", "_add_load_proxy")
+
     def __init__(self, time_series: TimeSeries, factor: float = 1.0):
         """Create a plain load pattern.
 
@@ -63,7 +67,7 @@ class PlainPattern(Pattern):
             factor: Optional scale factor applied to all loads in this pattern.
 
         Raises:
-            ValueError: If time_series is invalid or unmanaged.
+            ValueError: If time_series is invalid or unmanaged, or factor is not numeric.
         """
         super().__init__("Plain")
         if not isinstance(time_series, TimeSeries):
@@ -71,8 +75,11 @@ class PlainPattern(Pattern):
         if time_series.tag is None:
             raise ValueError("time_series must be managed before it is used by a pattern")
         self.time_series = time_series
-        self.factor = float(factor)
-        self._loads: List[Load] = []
+        self.factor = _as_float(factor, "factor")
+        # Keyed by id(load) so membership and removal are O(1) while the
+        # dict keeps insertion order for TCL emission.
+        self._loads: Dict[int, Load] = {}
+        self._add_load_proxy: Optional[PlainPattern._AddLoadProxy] = None
 
     def add_load_instance(self, load: Load) -> None:
         """Attach an existing load instance to this pattern.
@@ -87,10 +94,11 @@ class PlainPattern(Pattern):
         """
         if not isinstance(load, Load):
             raise ValueError("load must be an instance of Load")
-        if load in self._loads:
+        key = id(load)
+        if key in self._loads:
             return
         load.pattern_tag = self.tag
-        self._loads.append(load)
+        self._loads[key] = load
 
     def remove_load(self, load: Load) -> None:
         """Detach a load from this pattern if it is currently attached.
@@ -98,13 +106,12 @@ class PlainPattern(Pattern):
         Args:
             load: Attached Load instance to remove.
         """
-        if load in self._loads:
-            self._loads.remove(load)
+        if self._loads.pop(id(load), None) is not None:
             load.pattern_tag = None
 
     def clear_loads(self) -> None:
         """Detach all loads from this pattern."""
-        for load in self._loads:
+        for load in self._loads.values():
             load.pattern_tag = None
         self._loads.clear()
 
@@ -114,7 +121,7 @@ class PlainPattern(Pattern):
         Returns:
             List[Load]: A list of Load instances attached to this pattern.
         """
-        return list(self._loads)
+        return list(self._loads.values())
 
     def to_tcl(self) -> str:
         """Render this pattern and its attached loads as an OpenSees Tcl block.
@@ -123,11 +130,11 @@ class PlainPattern(Pattern):
             str: OpenSees Tcl command block for this pattern and its loads.
         """
         fact = f" -fact {self.factor}" if self.factor != 1.0 else ""
-        lines = [f"pattern Plain {self._require_tag()} {self.time_series.tag}{fact} {{"]
-        for load in self._loads:
-            lines.append(f"\t{load.to_tcl()}")
-        lines.append("}")
-        return "\n".join(lines)
+        header = f"pattern Plain {self._require_tag()} {self.time_series.tag}{fact} {{"
+        if not self._loads:
+            return f"{header}\n}}"
+        body = "\n\t".join([load.to_tcl() for load in self._loads.values()])
+        return f"{header}\n\t{body}\n}}"
 
     class _AddLoadProxy:
         """Factory proxy for creating and attaching loads to a PlainPattern.
@@ -149,6 +156,8 @@ class PlainPattern(Pattern):
             ```
         """
 
+        __slots__ = ("_pattern",)
+
         def __init__(self, pattern: "PlainPattern"):
             """Create a proxy for the given plain pattern.
 
@@ -216,9 +225,13 @@ class PlainPattern(Pattern):
 
         This property provides a convenient factory interface to create and
         automatically associate various types of loads (node, element, sp)
-        with this PlainPattern instance.
+        with this PlainPattern instance. The proxy is created on first access
+        and reused afterwards.
 
         Returns:
             PlainPattern._AddLoadProxy: An instance of `_AddLoadProxy` for creating and attaching loads.
         """
-        return PlainPattern._AddLoadProxy(self)
\ No newline at end of file
+        proxy = self._add_load_proxy
+        if proxy is None:
+            proxy = self._add_load_proxy = PlainPattern._AddLoadProxy(self)
+        return proxy
\ No newline at end of file
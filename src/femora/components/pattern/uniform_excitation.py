@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from femora.core.pattern_base import Pattern
+from femora.core.pattern_base import Pattern, _as_float, _as_int
 from femora.core.time_series_base import TimeSeries
 
 
@@ -49,6 +49,8 @@ class UniformExcitation(Pattern):
         "members": ["__init__"],
     }
 
+    __slots__ = ("dof", "time_series", "vel0", "factor")
+
     def __init__(
         self,
         dof: int,
@@ -68,19 +70,17 @@ class UniformExcitation(Pattern):
             ValueError: If dof is not a positive integer, or if time_series is not a managed TimeSeries instance.
         """
         super().__init__("UniformExcitation")
-        try:
-            self.dof = int(dof)
-        except Exception:
-            raise ValueError("dof must be an integer")
-        if self.dof < 1:
+        dof = _as_int(dof, "dof")
+        if dof < 1:
             raise ValueError("dof must be a positive integer")
         if not isinstance(time_series, TimeSeries):
             raise ValueError("time_series must be a TimeSeries object")
         if time_series.tag is None:
             raise ValueError("time_series must be managed before it is used by a pattern")
+        self.dof = dof
         self.time_series = time_series
-        self.vel0 = float(vel0)
-        self.factor = float(factor)
+        self.vel0 = _as_float(vel0, "vel0")
+        self.factor = _as_float(factor, "factor")
 
     def to_tcl(self) -> str:
         """Render this pattern as an OpenSees Tcl command.
@@ -91,9 +91,15 @@ class UniformExcitation(Pattern):
         Raises:
             ValueError: If the pattern has not been assigned a manager tag.
         """
-        cmd = f"pattern UniformExcitation {self._require_tag()} {self.dof} -accel {self.time_series.tag}"
-        if self.vel0 != 0.0:
-            cmd += f" -vel0 {self.vel0}"
-        if self.factor != 1.0:
-            cmd += f" -fact {self.factor}"
-        return cmd
+        tag = self._require_tag()
+        key = (tag, self.dof, self.time_series.tag, self.vel0, self.factor)
+        cache = self._tcl_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        tcl = f"pattern UniformExcitation {tag} {self.dof} -accel {self.time_series.tag}"
+        if self.vel0 != 0.0 or self.factor != 1.0:
+            vel0 = f" -vel0 {self.vel0}" if self.vel0 != 0.0 else ""
+            fact = f" -fact {self.factor}" if self.factor != 1.0 else ""
+            tcl = f"{tcl}{vel0}{fact}"
+        self._tcl_cache = (key, tcl)
+        return tcl
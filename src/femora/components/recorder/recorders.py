@@ -5,12 +5,50 @@
 # SPDX-License-Identifier: Apache-2.0
 # =============================================================================
 
-from typing import List, Dict, Optional, Union
+import os
+from typing import List, Dict, Optional, Tuple, Union
 
 from femora.core.group import ElementGroup
 from femora.core.recorder_base import Recorder
 from femora.components.interface.embedded_beam_solid_interface import EmbeddedBeamSolidInterface
 
+# Ordered names for error messages, with frozensets for membership checks
+_EBS_RESP_TYPES = (
+    "displacement", "localDisplacement", "axialDisp", "radialDisp",
+    "tangentialDisp", "globalForce", "localForce", "axialForce",
+    "radialForce", "tangentialForce", "solidForce", "beamForce", "beamLocalForce",
+)
+_NODE_RESP_TYPES = ("disp", "vel", "accel", "incrDisp", "reaction", "rayleighForces")
+_VTKHDF_RESP_TYPES = (
+    "disp", "vel", "accel",
+    "stress3D6", "strain3D6",
+    "stress2D3", "strain2D3",
+    "force2D", "force3D",
+    "localForce2D", "localForce3D",
+)
+_MPCO_NODE_RESPONSES = (
+    "displacement", "rotation",
+    "velocity", "angularVelocity",
+    "acceleration", "angularAcceleration",
+    "reactionForce", "reactionMoment",
+    "reactionForceIncludingInertia", "reactionMomentIncludingInertia",
+    "rayleighForce", "rayleighMoment",
+    "unbalancedForce", "unbalancedForceIncludingInertia",
+    "unbalancedMoment", "unbalancedMomentIncludingInertia",
+    "pressure",
+    "modesOfVibration", "modesOfVibrationRotational",
+)
+_MPCO_SENSITIVITIES = (
+    "displacementSensitivity", "rotationSensitivity",
+    "velocitySensitivity", "angularVelocitySensitivity",
+    "accelerationSensitivity", "angularAccelerationSensitivity",
+)
+_EBS_RESP_TYPE_SET = frozenset(_EBS_RESP_TYPES)
+_NODE_RESP_TYPE_SET = frozenset(_NODE_RESP_TYPES)
+_VTKHDF_RESP_TYPE_SET = frozenset(_VTKHDF_RESP_TYPES)
+_MPCO_NODE_RESPONSE_SET = frozenset(_MPCO_NODE_RESPONSES)
+_MPCO_SENSITIVITY_SET = frozenset(_MPCO_SENSITIVITIES)
+
 
 def _resolve_element_group_tag(recorder: Recorder, group_input) -> int:
     if isinstance(group_input, ElementGroup):
@@ -53,6 +91,69 @@ def _results_folder(recorder: Recorder) -> str:
     return folder + "/"
 
 
+def _pid_file_path(file_name: str, default_ext: str = "") -> str:
+    """Insert the MPI ``$pid`` marker before the file extension.
+
+    Only the last extension is split off, so dotted base names and directory
+    components are preserved.
+
+    Args:
+        file_name: Output file name, optionally with an extension.
+        default_ext: Extension (without the dot) used when ``file_name`` has none.
+
+    Returns:
+        The file name with ``$pid`` inserted before its extension.
+    """
+    root, ext = os.path.splitext(file_name)
+    if not ext and default_ext:
+        ext = "." + default_ext
+    return f"{root}$pid{ext}"
+
+
+def _cached_join(cache: Optional[Tuple[tuple, str]], values) -> Tuple[tuple, str]:
+    """Return ``(key, text)`` for ``values`` joined by spaces, reusing ``cache``.
+
+    The key is a tuple snapshot of ``values``, so the string is rebuilt only
+    when the values change, including through in-place edits of a list.
+    """
+    key = tuple(values)
+    if cache is not None and cache[0] == key:
+        return cache
+    return key, " ".join(map(str, key))
+
+
+def _as_interface_items(interface) -> Union[list, tuple]:
+    """Return the interface input as a sequence, wrapping a scalar in a tuple."""
+    return interface if isinstance(interface, list) else (interface,)
+
+
+def _resolve_interface(item, interface_manager) -> EmbeddedBeamSolidInterface:
+    """Resolve one interface instance or name against the model's interface manager.
+
+    Args:
+        item: EmbeddedBeamSolidInterface instance or registered interface name.
+        interface_manager: Interface manager of the recorder's owning model.
+
+    Returns:
+        The registered EmbeddedBeamSolidInterface instance.
+
+    Raises:
+        ValueError: If the interface is not registered or is of another kind.
+        TypeError: If ``item`` is neither an interface nor a name.
+    """
+    if isinstance(item, EmbeddedBeamSolidInterface):
+        interface_manager.require_registered(item)
+        return item
+    if isinstance(item, str):
+        resolved = interface_manager.require(item)
+        if not isinstance(resolved, EmbeddedBeamSolidInterface):
+            raise ValueError(
+                f"Interface '{item}' is registered but is not an EmbeddedBeamSolidInterface"
+            )
+        return resolved
+    raise TypeError("interfaces must be EmbeddedBeamSolidInterface instances or valid names")
+
+
 class EmbeddedBeamSolidInterfaceRecorder(Recorder):
     """Recorder for embedded beam-solid interfaces.
 
@@ -81,12 +182,12 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = ("_interface_input", "resp_type", "dt")
+
     def __init__(
         self,
         interface: Union[str, 'EmbeddedBeamSolidInterface', List[Union[str, 'EmbeddedBeamSolidInterface']]],
-        resp_type: Union[str, List[str]] = ["displacement", "localDisplacement", "axialDisp", "radialDisp",
-                   "tangentialDisp", "globalForce", "localForce", "axialForce",
-                   "radialForce", "tangentialForce", "solidForce", "beamForce","beamLocalForce"],
+        resp_type: Union[str, List[str], None] = None,
         dt: Union[float, None] = None,
         cores: Optional[Union[int, List[int]]] = None,
     ):
@@ -97,6 +198,7 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
                 EmbeddedBeamSolidInterface instance, a string name, or a list
                 of both.
             resp_type: The response type or list of response types to record.
+                Defaults to every supported response type.
             dt: Optional recording time step interval.
             cores: Optional processor core ID(s) for MPI execution.
 
@@ -108,20 +210,17 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
         if isinstance(interface, list):
             if not interface:
                 raise ValueError("interface list must not be empty")
-            for iface in interface:
-                if not isinstance(iface, (str, EmbeddedBeamSolidInterface)):
-                    raise ValueError(
-                        "All interfaces must be instances of EmbeddedBeamSolidInterface or valid names"
-                    )
-            self._interface_input = interface
-        elif isinstance(interface, (str, EmbeddedBeamSolidInterface)):
-            self._interface_input = interface
+            message = "All interfaces must be instances of EmbeddedBeamSolidInterface or valid names"
         else:
-            raise ValueError(
-                "interface must be an instance of EmbeddedBeamSolidInterface or a valid interface name"
-            )
-
-        if isinstance(resp_type, str):
+            message = "interface must be an instance of EmbeddedBeamSolidInterface or a valid interface name"
+        for iface in _as_interface_items(interface):
+            if not isinstance(iface, (EmbeddedBeamSolidInterface, str)):
+                raise ValueError(message)
+        self._interface_input = interface
+
+        if resp_type is None:
+            resp_type = list(_EBS_RESP_TYPES)
+        elif isinstance(resp_type, str):
             resp_type = [resp_type]
         elif not isinstance(resp_type, list):
             raise TypeError("resp_type must be a string or a list of strings")
@@ -129,9 +228,7 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
         self.resp_type = resp_type
 
         for resp in self.resp_type:
-            if resp not in ["displacement", "localDisplacement", "axialDisp", "radialDisp",
-                            "tangentialDisp", "globalForce", "localForce", "axialForce",
-                            "radialForce", "tangentialForce", "solidForce", "beamForce","beamLocalForce"]:
+            if resp not in _EBS_RESP_TYPE_SET:
                 raise ValueError(f"Invalid response type: {resp}. ")
 
         self.dt = dt
@@ -153,23 +250,10 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
                 "EmbeddedBeamSolidInterfaceRecorder must belong to a Model recorder manager before export"
             )
         interface_manager = mesh_maker.interface
-
-        def resolve_one(item: Union[str, EmbeddedBeamSolidInterface]) -> EmbeddedBeamSolidInterface:
-            if isinstance(item, str):
-                resolved = interface_manager.require(item)
-                if not isinstance(resolved, EmbeddedBeamSolidInterface):
-                    raise ValueError(
-                        f"Interface '{item}' is registered but is not an EmbeddedBeamSolidInterface"
-                    )
-                return resolved
-            if isinstance(item, EmbeddedBeamSolidInterface):
-                interface_manager.require_registered(item)
-                return item
-            raise TypeError("interfaces must be EmbeddedBeamSolidInterface instances or valid names")
-
-        if isinstance(self._interface_input, list):
-            return [resolve_one(item) for item in self._interface_input]
-        return [resolve_one(self._interface_input)]
+        return [
+            _resolve_interface(item, interface_manager)
+            for item in _as_interface_items(self._interface_input)
+        ]
 
     def _to_tcl_impl(self) -> str:
         """Convert this recorder to an OpenSees TCL command string.
@@ -178,15 +262,15 @@ class EmbeddedBeamSolidInterfaceRecorder(Recorder):
             The TCL command string.
         """
         # This recorder does not generate a TCL command, it writes directly to a file
-        cmd = "# recorder EmbeddedBeamSolidInterface\n"
+        chunks = ["# recorder EmbeddedBeamSolidInterface"]
         results_folder = _results_folder(self)
 
         for interface in self._resolve_interfaces():
-           cmd += interface._get_recorder(self.resp_type,
-                                          dt=self.dt,
-                                          results_folder=results_folder)
-           cmd += "\n"
-        return cmd
+            chunks.append(
+                interface._get_recorder(self.resp_type, dt=self.dt, results_folder=results_folder)
+            )
+        chunks.append("")
+        return "\n".join(chunks)
 
 
 class NodeRecorder(Recorder):
@@ -219,6 +303,13 @@ class NodeRecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = (
+        "file_name", "xml_file", "binary_file", "inet_addr", "port", "precision",
+        "time_series", "time", "delta_t", "close_on_write",
+        "nodes", "node_range", "region", "dofs", "resp_type",
+        "_nodes_tcl", "_dofs_tcl",
+    )
+
     def __init__(self, **kwargs):
         """Create a node recorder.
 
@@ -254,6 +345,8 @@ class NodeRecorder(Recorder):
         self.time = kwargs.get("time", False)
         self.delta_t = kwargs.get("delta_t", None)
         self.close_on_write = kwargs.get("close_on_write", False)
+        self._nodes_tcl = None
+        self._dofs_tcl = None
         self.nodes = kwargs.get("nodes", None)
         self.node_range = kwargs.get("node_range", None)
         self.region = kwargs.get("region", None)
@@ -282,13 +375,10 @@ class NodeRecorder(Recorder):
             raise ValueError("DOFs must be specified")
         if not self.resp_type:
             raise ValueError("Response type must be specified")
-        valid_resp_types = [
-            "disp", "vel", "accel", "incrDisp", "reaction", "rayleighForces",
-        ]
-        if not (self.resp_type in valid_resp_types or self.resp_type.startswith("eigen ")):
+        if not (self.resp_type in _NODE_RESP_TYPE_SET or self.resp_type.startswith("eigen ")):
             raise ValueError(
                 f"Invalid response type: {self.resp_type}. "
-                f"Valid types are: {', '.join(valid_resp_types)}, or 'eigen $mode'"
+                f"Valid types are: {', '.join(_NODE_RESP_TYPES)}, or 'eigen $mode'"
             )
 
     def _to_tcl_impl(self) -> str:
@@ -297,46 +387,48 @@ class NodeRecorder(Recorder):
         Returns:
             The TCL command string.
         """
-        cmd = "recorder Node"
+        parts = ["recorder Node"]
         
         # Output destination
         if self.file_name:
-            cmd += f" -file {self.file_name}"
+            parts.append(f"-file {self.file_name}")
         elif self.xml_file:
-            cmd += f" -xml {self.xml_file}"
+            parts.append(f"-xml {self.xml_file}")
         elif self.binary_file:
-            cmd += f" -binary {self.binary_file}"
+            parts.append(f"-binary {self.binary_file}")
         elif self.inet_addr and self.port:
-            cmd += f" -tcp {self.inet_addr} {self.port}"
+            parts.append(f"-tcp {self.inet_addr} {self.port}")
         
         # Other options
         if self.precision != 6:
-            cmd += f" -precision {self.precision}"
+            parts.append(f"-precision {self.precision}")
         
         if self.time_series:
-            cmd += f" -timeSeries {self.time_series}"
+            parts.append(f"-timeSeries {self.time_series}")
         
         if self.time:
-            cmd += " -time"
+            parts.append("-time")
         
         if self.delta_t:
-            cmd += f" -dT {self.delta_t}"
+            parts.append(f"-dT {self.delta_t}")
         
         if self.close_on_write:
-            cmd += " -closeOnWrite"
+            parts.append("-closeOnWrite")
         
         # Node selection
         if self.nodes:
-            cmd += f" -node {' '.join(map(str, self.nodes))}"
+            self._nodes_tcl = _cached_join(self._nodes_tcl, self.nodes)
+            parts.append(f"-node {self._nodes_tcl[1]}")
         elif self.node_range:
-            cmd += f" -nodeRange {self.node_range[0]} {self.node_range[1]}"
+            parts.append(f"-nodeRange {self.node_range[0]} {self.node_range[1]}")
         elif self.region:
-            cmd += f" -region {self.region}"
+            parts.append(f"-region {self.region}")
         
         # DOFs and response type
-        cmd += f" -dof {' '.join(map(str, self.dofs))} {self.resp_type}"
+        self._dofs_tcl = _cached_join(self._dofs_tcl, self.dofs)
+        parts.append(f"-dof {self._dofs_tcl[1]} {self.resp_type}")
         
-        return cmd
+        return " ".join(parts)
 
 
 class DriftRecorder(Recorder):
@@ -375,6 +467,8 @@ class DriftRecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = ("file_name", "i_nodes", "j_nodes", "dof", "perp_dirn", "time", "delta_t", "precision")
+
     def __init__(self, **kwargs):
         """Create a drift recorder.
 
@@ -550,6 +644,11 @@ class VTKHDFRecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = (
+        "file_base_name", "resp_types", "delta_t", "r_tol_dt", "region", "element_group",
+        "_file_path",
+    )
+
     def __init__(self, **kwargs):
         """Create a VTK HDF recorder.
 
@@ -585,20 +684,14 @@ class VTKHDFRecorder(Recorder):
 
         if not self.file_base_name:
             raise ValueError("File base name must be specified")
+        self._file_path = (self.file_base_name, _pid_file_path(self.file_base_name, "vtkhdf"))
         if not self.resp_types:
             raise ValueError("At least one response type must be specified")
-        valid_resp_types = [
-            "disp", "vel", "accel", 
-            "stress3D6", "strain3D6", 
-            "stress2D3", "strain2D3",
-            "force2D", "force3D", 
-            "localForce2D", "localForce3D",
-        ]
         for resp_type in self.resp_types:
-            if resp_type not in valid_resp_types:
+            if resp_type not in _VTKHDF_RESP_TYPE_SET:
                 raise ValueError(
                     f"Invalid response type: {resp_type}. "
-                    f"Valid types are: {', '.join(valid_resp_types)}"
+                    f"Valid types are: {', '.join(_VTKHDF_RESP_TYPES)}"
                 )
 
     def _to_tcl_impl(self) -> str:
@@ -607,41 +700,35 @@ class VTKHDFRecorder(Recorder):
         Returns:
             The TCL command string.
         """
-        # separete name and format of the file
-        name = self.file_base_name.split(".")
-        if len(name) < 2:
-            fileformat = "vtkhdf"
-        else:
-            fileformat = name[-1]
-        name = name[0]
-        name = name + "$pid"
+        source, file_base_name = self._file_path
+        if source != self.file_base_name:
+            file_base_name = _pid_file_path(self.file_base_name, "vtkhdf")
+            self._file_path = (self.file_base_name, file_base_name)
         results_folder = _results_folder(self)
         if results_folder != "./":
-            name = results_folder + name
-        file_base_name = name + "." + fileformat
+            file_base_name = results_folder + file_base_name
 
-        cmd = f"recorder vtkhdf {file_base_name}"
+        parts = [f"recorder vtkhdf {file_base_name}"]
         
         # Add optional parameters
         if self.delta_t is not None:
-            cmd += f" -dT {self.delta_t}"
+            parts.append(f"-dT {self.delta_t}")
 
         if self.r_tol_dt is not None:
-            cmd += f" -rTolDt {self.r_tol_dt}"
+            parts.append(f"-rTolDt {self.r_tol_dt}")
 
         # Add response types
-        for resp_type in self.resp_types:
-            cmd += f" {resp_type}"
+        parts.extend(self.resp_types)
 
         if self.region is not None:
             region_tags = self._resolve_regions(self.region)
             if len(region_tags) != 1:
                 raise ValueError("VTKHDFRecorder supports exactly one region")
-            cmd += f" -region {region_tags[0]}"
+            parts.append(f"-region {region_tags[0]}")
         elif self.element_group is not None:
-            cmd += f" -region {_resolve_element_group_tag(self, self.element_group)}"
+            parts.append(f"-region {_resolve_element_group_tag(self, self.element_group)}")
         
-        return cmd
+        return " ".join(parts)
 
 
 class MPCORecorder(Recorder):
@@ -673,6 +760,11 @@ class MPCORecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = (
+        "file_name", "node_responses", "element_responses", "node_sensitivities",
+        "regions", "element_groups", "delta_t", "num_steps", "_file_path",
+    )
+
     def __init__(self, **kwargs):
         """Create an MPCO recorder.
 
@@ -705,28 +797,17 @@ class MPCORecorder(Recorder):
 
         if not self.file_name:
             raise ValueError("File name must be specified for MPCO recorder")
+        self._file_path = (self.file_name, _pid_file_path(self.file_name))
         if self.node_responses is None:
             self.node_responses = []
         if not isinstance(self.node_responses, list):
             raise TypeError("node_responses must be a list of strings")
-        valid_node_responses = [
-            "displacement", "rotation",
-            "velocity", "angularVelocity",
-            "acceleration", "angularAcceleration",
-            "reactionForce", "reactionMoment",
-            "reactionForceIncludingInertia", "reactionMomentIncludingInertia",
-            "rayleighForce", "rayleighMoment",
-            "unbalancedForce", "unbalancedForceIncludingInertia",
-            "unbalancedMoment", "unbalancedMomentIncludingInertia",
-            "pressure",
-            "modesOfVibration", "modesOfVibrationRotational",
-        ]
         for resp in self.node_responses:
             if not isinstance(resp, str):
                 raise TypeError("Each node response must be a string")
-            if resp not in valid_node_responses:
+            if resp not in _MPCO_NODE_RESPONSE_SET:
                 raise ValueError(
-                    f"Invalid node response: {resp}. Valid: {', '.join(valid_node_responses)}"
+                    f"Invalid node response: {resp}. Valid: {', '.join(_MPCO_NODE_RESPONSES)}"
                 )
         if self.element_responses is None:
             self.element_responses = []
@@ -737,15 +818,10 @@ class MPCORecorder(Recorder):
                 raise TypeError("Each element response must be a string")
         if self.node_sensitivities is None:
             self.node_sensitivities = []
-        valid_sensitivity_names = [
-            "displacementSensitivity", "rotationSensitivity",
-            "velocitySensitivity", "angularVelocitySensitivity",
-            "accelerationSensitivity", "angularAccelerationSensitivity",
-        ]
-        normalized_pairs = []
         if not isinstance(self.node_sensitivities, list):
             raise TypeError("node_sensitivities must be a list of pairs or dicts")
-        for item in self.node_sensitivities:
+        normalized_pairs = [None] * len(self.node_sensitivities)
+        for i, item in enumerate(self.node_sensitivities):
             if isinstance(item, dict):
                 name = item.get("name")
                 par = item.get("param")
@@ -753,13 +829,13 @@ class MPCORecorder(Recorder):
                 name, par = item[0], item[1]
             else:
                 raise TypeError("node_sensitivities items must be (name, param) or {'name','param'}")
-            if name not in valid_sensitivity_names:
+            if name not in _MPCO_SENSITIVITY_SET:
                 raise ValueError(
-                    f"Invalid node sensitivity: {name}. Valid: {', '.join(valid_sensitivity_names)}"
+                    f"Invalid node sensitivity: {name}. Valid: {', '.join(_MPCO_SENSITIVITIES)}"
                 )
             if not isinstance(par, int):
                 raise TypeError("Sensitivity parameter id must be an integer")
-            normalized_pairs.append((name, par))
+            normalized_pairs[i] = (name, par)
         self.node_sensitivities = normalized_pairs
         if self.regions is None:
             self.regions = []
@@ -786,44 +862,41 @@ class MPCORecorder(Recorder):
         Returns:
             The TCL command string.
         """
+        source, file_path = self._file_path
+        if source != self.file_name:
+            file_path = _pid_file_path(self.file_name)
+            self._file_path = (self.file_name, file_path)
         results_folder = _results_folder(self)
-        file_path = self.file_name
-
-        file_ext = self.file_name.split(".")[-1]
-        if len(self.file_name.split(".")) > 1:
-            file_path = self.file_name.replace("." + file_ext, "$pid." + file_ext)
-        else:
-            file_path = self.file_name + "$pid"
-
         if results_folder != "./":
             file_path = results_folder + file_path
 
-        cmd = f'recorder mpco "{file_path}"'
+        parts = [f'recorder mpco "{file_path}"']
 
         if self.node_responses:
-            cmd += " -N " + " ".join(self.node_responses)
+            parts.append("-N")
+            parts.extend(self.node_responses)
 
         if self.element_responses:
-            cmd += " -E " + " ".join(self.element_responses)
+            parts.append("-E")
+            parts.extend(self.element_responses)
 
         if self.node_sensitivities:
-            ns_parts = []
+            parts.append("-NS")
             for name, par in self.node_sensitivities:
-                ns_parts.append(name)
-                ns_parts.append(str(par))
-            cmd += " -NS " + " ".join(ns_parts)
+                parts.append(name)
+                parts.append(str(par))
 
         for r in self.regions:
-            cmd += f" -R {r}"
+            parts.append(f"-R {r}")
         for group in self.element_groups:
-            cmd += f" -R {_resolve_element_group_tag(self, group)}"
+            parts.append(f"-R {_resolve_element_group_tag(self, group)}")
 
         if self.delta_t is not None:
-            cmd += f" -T dt {self.delta_t}"
+            parts.append(f"-T dt {self.delta_t}")
         elif self.num_steps is not None:
-            cmd += f" -T nsteps {self.num_steps}"
+            parts.append(f"-T nsteps {self.num_steps}")
 
-        return cmd
+        return " ".join(parts)
 
 
 class BeamForceRecorder(Recorder):
@@ -855,6 +928,11 @@ class BeamForceRecorder(Recorder):
         "members": ["__init__"],
     }
 
+    __slots__ = (
+        "meshparts", "force_type", "file_prefix", "delta_t",
+        "include_time", "output_format", "precision",
+    )
+
     def __init__(self, **kwargs):
         """Create a beam force recorder.
 
@@ -1012,20 +1090,18 @@ class BeamForceRecorder(Recorder):
             if beam_mask_all is not None:
                 mask = mask & beam_mask_all
 
-            idxs = np.where(mask)[0]
-            if idxs.size == 0:
+            part_cores = cores[mask]
+            if part_cores.size == 0:
                 lines.append(f"# No beam elements found for meshpart '{name}'")
                 continue
 
-            # Map indices to element tags
-            ele_tags = (start_ele_tag + idxs).astype(int)
+            # Ascending cell indices of this part; tags are offset per core below
+            mask_indices = np.flatnonzero(mask)
 
             # group by core
-            part_cores = cores[idxs]
             unique_cores = np.unique(part_cores)
             for core in unique_cores:
-                core_mask = (part_cores == core)
-                core_tags = np.sort(ele_tags[core_mask])
+                core_tags = mask_indices[part_cores == core] + start_ele_tag
                 if core_tags.size == 0:
                     continue
 
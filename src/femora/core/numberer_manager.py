@@ -25,11 +25,13 @@ class NumbererManager:
 
     def _cached(self, key: str) -> Numberer:
         key = key.lower()
-        if key not in self._instances:
-            if key not in Numberer._numberers:
+        numberer = self._instances.get(key)
+        if numberer is None:
+            numberer_cls = Numberer._numberers.get(key)
+            if numberer_cls is None:
                 raise ValueError(f"Unknown numberer type: {key}")
-            self._instances[key] = Numberer._numberers[key]()
-        return self._instances[key]
+            numberer = self._instances[key] = numberer_cls()
+        return numberer
 
     def plain(self) -> Numberer:
         return self._cached("plain")
@@ -8,7 +8,37 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Hashable, Optional, Tuple
+
+
+def _as_float(value: Any, name: str) -> float:
+    """Return ``value`` as a float, skipping the conversion for exact floats.
+
+    Raises:
+        ValueError: If ``value`` cannot be converted to a float.
+    """
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{name} must be a number") from None
+
+
+def _as_int(value: Any, name: str) -> int:
+    """Return ``value`` as an int, skipping the conversion for exact ints.
+
+    ``bool`` and NumPy integers are still normalized to plain ``int``.
+
+    Raises:
+        ValueError: If ``value`` cannot be converted to an integer.
+    """
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{name} must be an integer") from None
 
 
 class Pattern(ABC):
@@ -27,10 +57,13 @@ class Pattern(ABC):
         pattern_type: OpenSees pattern type name used by concrete classes.
     """
 
+    __slots__ = ("tag", "_owner", "pattern_type", "_tcl_cache", "__weakref__")
+
     def __init__(self, pattern_type: str):
         self.tag: Optional[int] = None
         self._owner: object | None = None
         self.pattern_type = pattern_type
+        self._tcl_cache: Optional[Tuple[Hashable, str]] = None
 
     def _require_tag(self) -> int:
         """Return the assigned tag or fail if the instance is unmanaged.
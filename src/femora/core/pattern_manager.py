@@ -42,6 +42,7 @@ class PatternManager:
         self._mesh_maker = mesh_maker
         self._patterns: Dict[int, Pattern] = {}
         self._start_tag = 1
+        self._next_tag = 1
         self._tagging = CompactRetagPolicy[Pattern]()
         self._time_series_manager = time_series_manager
         self._ground_motion_manager = ground_motion_manager
@@ -67,15 +68,20 @@ class PatternManager:
         elif pattern._owner is not self:
             raise ValueError("pattern already belongs to another manager")
         self._validate_dependencies(pattern)
-        try:
-            pattern.tag = self._tagging.assign_tag(
-                self._patterns,
-                pattern,
-                self._start_tag,
-            )
-        except ValueError as exc:
-            raise ValueError(f"Pattern tag {pattern.tag} already exists") from exc
+        if pattern.tag is None:
+            pattern.tag = self._next_tag
+        else:
+            try:
+                pattern.tag = self._tagging.assign_tag(
+                    self._patterns,
+                    pattern,
+                    self._start_tag,
+                )
+            except ValueError as exc:
+                raise ValueError(f"Pattern tag {pattern.tag} already exists") from exc
         self._patterns[pattern.tag] = pattern
+        if pattern.tag == self._next_tag:
+            self._advance_next_tag()
         self._sync_attached_load_tags(pattern)
         return pattern
 
@@ -104,6 +110,7 @@ class PatternManager:
         if pattern is not None:
             pattern.tag = None
             pattern._owner = None
+            pattern._tcl_cache = None
             self._reassign_tags()
 
     def clear(self) -> None:
@@ -111,7 +118,9 @@ class PatternManager:
         for pattern in self._patterns.values():
             pattern.tag = None
             pattern._owner = None
+            pattern._tcl_cache = None
         self._patterns.clear()
+        self._next_tag = self._start_tag
 
     def set_tag_start(self, start_tag: int) -> None:
         """Set the first tag used by this manager and retag existing patterns.
@@ -209,11 +218,23 @@ class PatternManager:
 
     def _next_available_tag(self) -> int:
         """Return the next unused pattern tag in this manager's tag space."""
-        return self._tagging.next_available_tag(self._patterns, self._start_tag)
+        return self._next_tag
+
+    def _advance_next_tag(self) -> None:
+        """Move ``_next_tag`` past tags that are already occupied.
+
+        Every tag in ``[_start_tag, _next_tag)`` is in use, so the scan only
+        resumes from the previous hint instead of probing from ``_start_tag``.
+        """
+        tag = self._next_tag
+        while tag in self._patterns:
+            tag += 1
+        self._next_tag = tag
 
     def _reassign_tags(self) -> None:
         """Retag all managed patterns from ``_start_tag`` in tag order."""
         self._tagging.reassign_tags(self._patterns, self._start_tag)
+        self._next_tag = self._start_tag + len(self._patterns)
         for pattern in self._patterns.values():
             self._sync_attached_load_tags(pattern)
 
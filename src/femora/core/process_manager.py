@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TextIO, Union
 import weakref
 
 from femora.components.analysis.analysis import Analysis
@@ -21,6 +21,54 @@ if TYPE_CHECKING:
 
 ProcessComponent = Union[SPConstraint, MPConstraint, Pattern, Recorder, Analysis, Action]
 
+# Model-owned components are held weakly; actions are owned by their steps.
+_WEAKLY_HELD_TYPES = (SPConstraint, MPConstraint, Pattern, Recorder, Analysis)
+
+
+class Step:
+    """One ordered entry of a ``ProcessManager``.
+
+    ``component`` holds an ``Action`` or a weak reference to a model-owned
+    component. Item access such as ``step["description"]`` is kept for code
+    written against the former dict-based steps.
+    """
+
+    __slots__ = ("component", "description")
+
+    def __init__(self, component, description: str = ""):
+        self.component = component
+        self.description = description
+
+    def __getitem__(self, key: str):
+        """Return a step field by name, as the former dict-based steps did.
+
+        Args:
+            key: Field name, ``"component"`` or ``"description"``.
+
+        Returns:
+            The stored component reference or the step description.
+
+        Raises:
+            KeyError: If ``key`` is not a step field.
+        """
+        if key not in Step.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        """Return a step field by name, or ``default`` if it is not a field.
+
+        Args:
+            key: Field name, ``"component"`` or ``"description"``.
+            default: Value returned when ``key`` is not a step field.
+
+        Returns:
+            The field value, or ``default``.
+        """
+        if key not in Step.__slots__:
+            return default
+        return getattr(self, key)
+
 
 class ProcessManager:
     """Model-owned manager for ordered analysis/process steps."""
@@ -31,7 +79,7 @@ class ProcessManager:
         if not isinstance(mesh_maker, ModelClass):
             raise TypeError("mesh_maker must be a Model instance")
         self._mesh_maker = mesh_maker
-        self.steps: List[Dict] = []
+        self.steps: List[Step] = []
         self.current_step = -1
 
     def __iter__(self):
@@ -51,14 +99,7 @@ class ProcessManager:
                 last_index = self.add_step(comp, description)
             return last_index
 
-        component_ref = self._store_component_ref(component)
-
-        step = {
-            "component": component_ref,
-            "description": description,
-        }
-
-        self.steps.append(step)
+        self.steps.append(Step(self._store_component_ref(component), description))
         return len(self.steps) - 1
 
     def insert_step(
@@ -77,14 +118,7 @@ class ProcessManager:
             index += len(self.steps) + 1
 
         if 0 <= index <= len(self.steps):
-            component_ref = self._store_component_ref(component)
-
-            step = {
-                "component": component_ref,
-                "description": description,
-            }
-
-            self.steps.insert(index, step)
+            self.steps.insert(index, Step(self._store_component_ref(component), description))
 
             if index <= self.current_step:
                 self.current_step += 1
@@ -102,37 +136,100 @@ class ProcessManager:
             return True
         return False
 
+    def remove_steps(self, indices: Iterable[int]) -> int:
+        """Remove several steps in a single pass.
+
+        Indices outside the step list are ignored, as in ``remove_step``.
+
+        Args:
+            indices: Positions of the steps to remove, in any order.
+
+        Returns:
+            int: Number of steps removed.
+        """
+        count = len(self.steps)
+        doomed = {index for index in indices if 0 <= index < count}
+        if not doomed:
+            return 0
+        self.current_step -= sum(1 for index in doomed if index <= self.current_step)
+        self.steps[:] = [step for index, step in enumerate(self.steps) if index not in doomed]
+        return len(doomed)
+
     def clear(self) -> None:
         self.steps.clear()
         self.current_step = -1
 
-    def get_steps(self) -> List[Dict]:
+    def compact(self) -> int:
+        """Drop steps whose weakly held component no longer exists.
+
+        Returns:
+            int: Number of steps removed.
+        """
+        kept: List[Step] = []
+        removed_before_current = 0
+        for index, step in enumerate(self.steps):
+            if self._resolve(step.component) is None:
+                if index <= self.current_step:
+                    removed_before_current += 1
+                continue
+            kept.append(step)
+        removed = len(self.steps) - len(kept)
+        if removed:
+            self.steps[:] = kept
+            self.current_step -= removed_before_current
+        return removed
+
+    def get_steps(self) -> List[Step]:
         return self.steps
 
-    def get_step(self, index: int) -> Optional[Dict]:
+    def get_step(self, index: int) -> Optional[Step]:
         if 0 <= index < len(self.steps):
             return self.steps[index]
         return None
 
     def to_tcl(self) -> str:
-        tcl_script = ""
+        return "".join(self._iter_tcl())
+
+    def write_tcl(self, fileobj: TextIO) -> None:
+        """Write the process script to ``fileobj`` step by step.
+
+        Produces the same text as ``to_tcl()`` without building the whole
+        script in memory first.
+        """
+        write = fileobj.write
+        for chunk in self._iter_tcl():
+            write(chunk)
+
+    def _iter_tcl(self) -> Iterator[str]:
+        """Yield the process script in chunks, one header and body per step.
+
+        Steps whose weakly held component was released are skipped.
+
+        Returns:
+            Iterator[str]: Consecutive pieces of the script produced by ``to_tcl()``.
+        """
+        resolve = self._resolve
         for step in self.steps:
-            component = step["component"]
-            if isinstance(component, weakref.ref):
-                component = component()
-            description = step["description"]
-            tcl_script += f"# {description} ======================================\n\n"
-            tcl_script += f"{component.to_tcl()}\n\n\n"
-        return tcl_script
+            component = resolve(step.component)
+            if component is None:
+                # The model released this component; see compact().
+                continue
+            yield f"# {step.description} ======================================\n\n"
+            yield f"{component.to_tcl()}\n\n\n"
+
+    @staticmethod
+    def _resolve(component_ref):
+        """Return the component behind a step, or ``None`` if it was released."""
+        # Exact type check: stored refs are always plain weakref.ref objects.
+        if type(component_ref) is weakref.ref:
+            return component_ref()
+        return component_ref
 
     @staticmethod
     def _store_component_ref(component: ProcessComponent):
         if isinstance(component, Action):
             return component
-        if isinstance(
-            component,
-            (SPConstraint, MPConstraint, Pattern, Recorder, Analysis),
-        ):
+        if isinstance(component, _WEAKLY_HELD_TYPES):
             return weakref.ref(component)
         raise TypeError(
             f"Invalid component type: {type(component)}. Must be one of the allowed types."
@@ -20,6 +20,8 @@ class Recorder(ABC):
     assignment and lifecycle for a single model context.
     """
 
+    __slots__ = ("tag", "_owner", "recorder_type", "cores", "__weakref__")
+
     def __init__(
         self,
         recorder_type: str,
@@ -80,15 +82,10 @@ class Recorder(ABC):
                 raise ValueError(f"Region with name '{item}' not found")
             raise TypeError("regions must contain ints, names, or RegionBase instances")
 
-        tags: List[int] = []
         if isinstance(regions_input, (list, tuple)):
-            for it in regions_input:
-                tag = resolve_one(it)
-                if tag not in tags:
-                    tags.append(tag)
-        else:
-            tags = [resolve_one(regions_input)]
-        return tags
+            # dict keys drop repeats in one hashed pass and keep first-seen order
+            return list(dict.fromkeys(resolve_one(it) for it in regions_input))
+        return [resolve_one(regions_input)]
 
 
 __all__ = ["Recorder"]
@@ -26,7 +26,9 @@ class TaggedComponentManager(Generic[TComponent]):
     ):
         self._owner = owner
         self._component_cls = component_cls
-        self._registry_attr = registry_attr
+        # Registries are class-level dicts updated in place by their
+        # register_* helpers, so the mapping can be bound once here.
+        self._registry: Dict[str, Type[TComponent]] = getattr(component_cls, registry_attr)
         self._items: Dict[int, TComponent] = {}
         self._start_tag = 1
         self._tagging = CompactRetagPolicy[TComponent]()
@@ -46,11 +48,10 @@ class TaggedComponentManager(Generic[TComponent]):
         return component
 
     def create(self, component_type: str, **kwargs) -> TComponent:
-        registry: Dict[str, Type[TComponent]] = getattr(self._component_cls, self._registry_attr)
-        key = component_type.lower()
-        if key not in registry:
+        component_cls = self._registry.get(component_type.lower())
+        if component_cls is None:
             raise ValueError(f"Unknown {self._component_cls.__name__} type: {component_type}")
-        return self.add(registry[key](**kwargs))
+        return self.add(component_cls(**kwargs))
 
     def get(self, tag: int) -> Optional[TComponent]:
         return self._items.get(int(tag))
@@ -76,8 +77,7 @@ class TaggedComponentManager(Generic[TComponent]):
         self._reassign_tags()
 
     def get_available_types(self) -> list[str]:
-        registry: Dict[str, Type[TComponent]] = getattr(self._component_cls, self._registry_attr)
-        return list(registry.keys())
+        return list(self._registry)
 
     def _reassign_tags(self) -> None:
         self._tagging.reassign_tags(self._items, self._start_tag)
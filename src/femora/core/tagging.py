@@ -48,19 +48,50 @@ class CompactRetagPolicy(TaggingPolicy[TTagged]):
     def assign_tag(self, store: Dict[int, TTagged], obj: TTagged, start_tag: int) -> int:
         if obj.tag is None:
             return self.next_available_tag(store, start_tag)
-        if obj.tag in store and store[obj.tag] is not obj:
+        existing = store.get(obj.tag)
+        if existing is not None and existing is not obj:
             raise ValueError(f"Tag {obj.tag} already exists")
         return obj.tag
 
     def reassign_tags(self, store: Dict[int, TTagged], start_tag: int) -> None:
-        items = sorted(
-            store.values(),
-            key=lambda item: item.tag if item.tag is not None else 0,
-        )
-        store.clear()
-        for offset, obj in enumerate(items):
-            obj.tag = start_tag + offset
-            store[obj.tag] = obj
+        if not self._is_tag_ordered(store):
+            items = sorted(
+                store.values(),
+                key=lambda item: item.tag if item.tag is not None else 0,
+            )
+            store.clear()
+            for offset, obj in enumerate(items):
+                obj.tag = start_tag + offset
+                store[obj.tag] = obj
+            return
+
+        # Keep the already-compact prefix in place and renumber only the tail.
+        first_gap = None
+        for offset, key in enumerate(store):
+            if key != start_tag + offset:
+                first_gap = offset
+                break
+        if first_gap is None:
+            return
+        tail = [store.pop(key) for key in list(store)[first_gap:]]
+        for tag, obj in enumerate(tail, start=start_tag + first_gap):
+            obj.tag = tag
+            store[tag] = obj
+
+    @staticmethod
+    def _is_tag_ordered(store: Dict[int, TTagged]) -> bool:
+        """Return whether ``store`` already iterates in ascending tag order.
+
+        Sequentially added objects keep insertion order equal to tag order,
+        so the common retag path can skip sorting entirely.
+        """
+        keys = iter(store)
+        previous = next(keys, None)
+        for key in keys:
+            if key < previous:
+                return False
+            previous = key
+        return True
 
     @staticmethod
     def next_available_tag(store: Dict[int, TTagged], start_tag: int) -> int:
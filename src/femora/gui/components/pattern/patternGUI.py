@@ -1,16 +1,290 @@
-from qtpy.QtCore import Qt
+import numpy as np
+from qtpy.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QTimer, Signal
 from qtpy.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, 
+    QComboBox, QPushButton, QTableView, QStyledItemDelegate, 
+    QStyleOptionButton, QStyle, QApplication, QFileDialog, 
     QDialog, QFormLayout, QMessageBox, QHeaderView, QGridLayout, 
-    QStackedWidget, QScrollArea, QTextEdit
+    QStackedWidget, QScrollArea
 )
 
 from femora.components.Pattern.patternBase import Pattern, PatternManager
-from femora.components.TimeSeries.timeSeriesBase import TimeSeries, TimeSeriesManager
+from femora.components.TimeSeries.timeSeriesBase import TimeSeries
 from femora.components.MeshMaker import MeshMaker
 from femora.utils.validator import DoubleValidator, IntValidator
 
+
+# Help text shown under the creation dialog forms
+_UNIFORM_EXCITATION_NOTES = (
+    "Notes:\n"
+    "- The DOF direction specifies the degrees of freedom affected by the motion\n"
+    "- For standard models: 1=X, 2=Y, 3=Z\n"
+    "- The responses obtained from the nodes are RELATIVE values\n"
+    "- Time Series defines the acceleration history\n"
+    "- Initial velocity allows setting a non-zero starting velocity\n"
+    "- Factor allows scaling the input motion"
+)
+
+_H5DRM_NOTES = (
+    "Notes:\n"
+    "- Factor: Scale DRM dataset displacements and accelerations\n"
+    "- Coordinate Scale: Scale coordinates for unit conversion\n"
+    "- Distance Tolerance: For DRM point to FE mesh matching\n"
+    "- Transformation Matrix: Applied to dataset coordinates\n"
+    "- Origin: Location after transformation"
+)
+
+
+# Row-major identity text for the H5DRM transformation matrix inputs
+_IDENTITY_MATRIX_TEXTS = tuple("1.0" if i == j else "0.0" for i in range(3) for j in range(3))
+
+_ORIGIN_LABELS = ("X:", "Y:", "Z:")
+
+
+# Validators are stateless, so one instance per class serves every input field
+_VALIDATORS = {}
+
+
+def _get_validator(validator_cls):
+    """Return the shared instance of a validator class, creating it on first use"""
+    validator = _VALIDATORS.get(validator_cls)
+    if validator is None:
+        validator = _VALIDATORS[validator_cls] = validator_cls()
+    return validator
+
+
+# Time series GUI class, imported on first use rather than at module load
+_TimeSeriesManagerTab = None
+
+
+def _get_ts_tab():
+    """Return the TimeSeriesManagerTab class, importing it on first use"""
+    global _TimeSeriesManagerTab
+    if _TimeSeriesManagerTab is None:
+        from femora.components.TimeSeries.timeSeriesGUI import TimeSeriesManagerTab
+        _TimeSeriesManagerTab = TimeSeriesManagerTab
+    return _TimeSeriesManagerTab
+
+
+def _parse_float(text, default):
+    """Parse an optional numeric field, returning ``default`` when it is empty"""
+    if not text:
+        return default
+    return float(text)
+
+
+def _fill_time_series_combo(combo, time_series_dict, current_tag=None):
+    """Repopulate a time series combo in one batch and select ``current_tag``.
+
+    Signals are blocked while the items are rebuilt so listeners see a
+    single ``currentIndexChanged`` once the combo is filled.
+
+    Returns:
+        dict: Combo index of each time series, keyed by tag.
+    """
+    index_by_tag = {}
+    combo.blockSignals(True)
+    try:
+        combo.clear()
+        for i, (tag, ts) in enumerate(time_series_dict.items()):
+            combo.addItem(f"{ts.series_type} (Tag: {tag})", ts)
+            index_by_tag[tag] = i
+        if combo.count() > 0:
+            combo.setCurrentIndex(index_by_tag.get(current_tag, 0))
+    finally:
+        combo.blockSignals(False)
+    combo.currentIndexChanged.emit(combo.currentIndex())
+    return index_by_tag
+
+
+def _format_uniform_excitation_params(params_dict):
+    """Summarize UniformExcitation parameters for the patterns table"""
+    parts = [f"DOF: {params_dict['dof']}", f"TimeSeries: {params_dict['time_series'].tag}"]
+    vel0 = params_dict.get('vel0', 0.0)
+    if vel0 != 0.0:
+        parts.append(f"Velocity: {vel0}")
+    factor = params_dict.get('factor', 1.0)
+    if factor != 1.0:
+        parts.append(f"Factor: {factor}")
+    return ", ".join(parts)
+
+
+def _format_h5drm_params(params_dict):
+    """Summarize H5DRM parameters for the patterns table"""
+    return f"File: {params_dict['filepath']}, Factor: {params_dict['factor']}"
+
+
+# Parameter summary formatter per pattern type; other types fall back to str()
+_PARAM_FORMATTERS = {
+    "UniformExcitation": _format_uniform_excitation_params,
+    "H5DRM": _format_h5drm_params,
+}
+
+
+def _format_pattern_params(pattern):
+    """Return the summary shown in the Parameters column for a pattern"""
+    return _PARAM_FORMATTERS.get(pattern.pattern_type, str)(pattern.get_values())
+
+
+class PatternTableModel(QAbstractTableModel):
+    """Read-only table model over the managed patterns.
+
+    Rows hold pattern objects and tags are read from them live, because the
+    manager may renumber patterns when one is removed. Cell text is produced
+    lazily in ``data()`` so only the rows the view actually paints are
+    formatted. Formatted parameter strings are kept until the next reset,
+    and ``Qt.UserRole`` returns the row's pattern tag.
+    """
+
+    HEADERS = ["Tag", "Type", "Parameters", "Edit", "Delete"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._tags = []
+        self._row_by_id = None
+        self._params_cache = {}
+
+    def set_patterns(self, patterns, force=False):
+        """Replace the displayed rows with the given ``{tag: pattern}`` dict.
+
+        The model is left untouched when the same patterns are already shown
+        under the same tags, unless ``force`` is set.
+
+        Returns:
+            bool: ``True`` if the model was reset.
+        """
+        tags = list(patterns)
+        rows = list(patterns.values())
+        if (
+            not force
+            and tags == self._tags
+            and all(new is old for new, old in zip(rows, self._rows))
+        ):
+            return False
+        self.beginResetModel()
+        self._rows = rows
+        self._tags = tags
+        # The row index is only needed for single-row removal; build it then
+        self._row_by_id = None
+        self._params_cache = {}
+        self.endResetModel()
+        return True
+
+    def pattern_at(self, row):
+        """Return the pattern shown in ``row``"""
+        return self._rows[row]
+
+    def remove_pattern(self, pattern):
+        """Remove the row of a single pattern without resetting the model.
+
+        Returns:
+            bool: ``False`` if the pattern is not shown in the table.
+        """
+        if self._row_by_id is None:
+            self._row_by_id = {id(p): row for row, p in enumerate(self._rows)}
+        row = self._row_by_id.pop(id(pattern), None)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        # Record the tags as renumbered by the manager so the next refresh
+        # sees the table as current
+        self._tags = [p.tag for p in self._rows]
+        self._params_cache.pop(id(pattern), None)
+        self._row_by_id = {
+            key: (r - 1 if r > row else r) for key, r in self._row_by_id.items()
+        }
+        self.endRemoveRows()
+        # The manager renumbers the patterns that followed the removed one
+        if row < len(self._rows):
+            self.dataChanged.emit(self.index(row, 0), self.index(len(self._rows) - 1, 0))
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pattern = self._rows[index.row()]
+        if role == Qt.UserRole:
+            # Every cell of a row carries the pattern tag for click dispatch
+            return pattern.tag
+        if role != Qt.DisplayRole:
+            return None
+        column = index.column()
+        if column == 0:
+            return str(pattern.tag)
+        if column == 1:
+            return pattern.pattern_type
+        if column == 2:
+            params_str = self._params_cache.get(id(pattern))
+            if params_str is None:
+                params_str = self._params_cache[id(pattern)] = _format_pattern_params(pattern)
+            return params_str
+        # Button columns show their header text as the button label
+        return self.HEADERS[column]
+
+
+class PatternTableView(QTableView):
+    """Table view with a fixed size hint for the Parameters column.
+
+    The Parameters column is sized to its contents, and the default hint
+    formats and measures every row, which is the slow part of showing a long
+    pattern list.
+    """
+
+    PARAMETERS_COLUMN_WIDTH = 400
+
+    def sizeHintForColumn(self, column):
+        if column == 2:
+            return self.PARAMETERS_COLUMN_WIDTH
+        return super().sizeHintForColumn(column)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paint a push button in each cell and report clicks by row and column.
+
+    Drawing the button with the current style avoids creating one
+    ``QPushButton`` widget per row, and a single instance can serve every
+    button column of a view.
+    """
+
+    clicked = Signal(int, int)
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data(Qt.DisplayRole)
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.pos())
+        ):
+            self.clicked.emit(index.row(), index.column())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class PatternManagerTab(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -21,13 +295,12 @@ class PatternManagerTab(QDialog):
         
         # Get the pattern manager instance
         self.pattern_manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-        self.time_series_manager = TimeSeriesManager(mesh_maker=MeshMaker.get_instance())
         
         # Main layout
         layout = QVBoxLayout(self)
         
         # Pattern type selection
-        type_layout = QGridLayout()
+        type_row = QHBoxLayout()
         
         # Pattern type dropdown
         self.pattern_type_combo = QComboBox()
@@ -36,102 +309,108 @@ class PatternManagerTab(QDialog):
         create_pattern_btn = QPushButton("Create New Pattern")
         create_pattern_btn.clicked.connect(self.open_pattern_creation_dialog)
         
-        type_layout.addWidget(QLabel("Pattern Type:"), 0, 0)
-        type_layout.addWidget(self.pattern_type_combo, 0, 1)
-        type_layout.addWidget(create_pattern_btn, 1, 0, 1, 2)
+        type_row.addWidget(QLabel("Pattern Type:"))
+        type_row.addWidget(self.pattern_type_combo, 1)
         
-        layout.addLayout(type_layout)
+        layout.addLayout(type_row)
+        layout.addWidget(create_pattern_btn)
         
         # Patterns table
-        self.patterns_table = QTableWidget()
-        self.patterns_table.setColumnCount(5)  # Tag, Type, Parameters, Edit, Delete
-        self.patterns_table.setHorizontalHeaderLabels(["Tag", "Type", "Parameters", "Edit", "Delete"])
+        self.patterns_model = PatternTableModel(self)
+        self.patterns_table = PatternTableView()
+        self.patterns_table.setModel(self.patterns_model)
+        self.patterns_table.setSelectionBehavior(QTableView.SelectRows)
+        self.patterns_table.verticalHeader().setVisible(False)
+        
+        # Edit/Delete columns are painted by one delegate instead of cell widgets
+        self.button_delegate = ButtonDelegate(self.patterns_table)
+        self.button_delegate.clicked.connect(self._on_button_clicked)
+        self.patterns_table.setItemDelegateForColumn(3, self.button_delegate)
+        self.patterns_table.setItemDelegateForColumn(4, self.button_delegate)
+        
         header = self.patterns_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)  # Stretch all columns
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents) # Except for the first one
+        header.setSectionResizeMode(0, QHeaderView.Interactive)  # Except for the first one
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Uses the fixed hint
+        self.patterns_table.setColumnWidth(0, 60)
         
         layout.addWidget(self.patterns_table)
         
         # Refresh patterns button
         refresh_btn = QPushButton("Refresh Patterns List")
-        refresh_btn.clicked.connect(self.refresh_patterns_list)
+        refresh_btn.clicked.connect(self.reload_patterns_list)
         layout.addWidget(refresh_btn)
         
+        # Set by reload_patterns_list so the next refresh resets the table
+        self._force_reload = False
+        
+        # Creation dialogs are built once per pattern type and reused
+        self._create_dialogs = {}
+        
+        # Coalesce refresh requests made within one event loop window
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         # Initial refresh
-        self.refresh_patterns_list()
+        self._do_refresh()
 
     def open_pattern_creation_dialog(self):
         """Open dialog to create a new pattern of selected type"""
         pattern_type = self.pattern_type_combo.currentText()
         
-        if pattern_type.lower() == "uniformexcitation":
-            dialog = UniformExcitationCreationDialog(self)
-        elif pattern_type.lower() == "h5drm":
-            dialog = H5DRMCreationDialog(self)
+        key = pattern_type.lower()
+        dialog = self._create_dialogs.get(key)
+        if dialog is None:
+            dialog_cls = _CREATION_DIALOGS.get(key)
+            if dialog_cls is None:
+                QMessageBox.warning(self, "Error", f"No creation dialog available for pattern type: {pattern_type}")
+                return
+            dialog = self._create_dialogs[key] = dialog_cls(self)
         else:
-            QMessageBox.warning(self, "Error", f"No creation dialog available for pattern type: {pattern_type}")
-            return
+            dialog.reset_fields()
         
         if dialog.exec() == QDialog.Accepted:
             self.refresh_patterns_list()
 
     def refresh_patterns_list(self):
-        """Update the patterns table with current patterns"""
-        self.patterns_table.setRowCount(0)
-        patterns = Pattern.get_all_patterns()
-        
-        self.patterns_table.setRowCount(len(patterns))
-        
-        for row, (tag, pattern) in enumerate(patterns.items()):
-            # Tag
-            tag_item = QTableWidgetItem(str(tag))
-            tag_item.setFlags(tag_item.flags() & ~Qt.ItemIsEditable)
-            self.patterns_table.setItem(row, 0, tag_item)
-            
-            # Pattern Type
-            type_item = QTableWidgetItem(pattern.pattern_type)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.patterns_table.setItem(row, 1, type_item)
-            
-            # Parameters
-            params_dict = pattern.get_values()
-            if pattern.pattern_type == "UniformExcitation":
-                params_str = f"DOF: {params_dict['dof']}, TimeSeries: {params_dict['time_series'].tag}"
-                if params_dict.get('vel0', 0.0) != 0.0:
-                    params_str += f", Velocity: {params_dict['vel0']}"
-                if params_dict.get('factor', 1.0) != 1.0:
-                    params_str += f", Factor: {params_dict['factor']}"
-            elif pattern.pattern_type == "H5DRM":
-                params_str = f"File: {params_dict['filepath']}, Factor: {params_dict['factor']}"
-            else:
-                params_str = str(params_dict)
-                
-            params_item = QTableWidgetItem(params_str)
-            params_item.setFlags(params_item.flags() & ~Qt.ItemIsEditable)
-            self.patterns_table.setItem(row, 2, params_item)
-            
-            # Edit button
-            edit_btn = QPushButton("Edit")
-            edit_btn.clicked.connect(lambda checked, p=pattern: self.open_pattern_edit_dialog(p))
-            self.patterns_table.setCellWidget(row, 3, edit_btn)
-            
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda checked, t=tag: self.delete_pattern(t))
-            self.patterns_table.setCellWidget(row, 4, delete_btn)
+        """Schedule a patterns table update, coalescing repeated requests"""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Update the patterns table if the managed patterns have changed"""
+        force, self._force_reload = self._force_reload, False
+        # Repaint once after the reset rather than on each intermediate change
+        self.patterns_table.setUpdatesEnabled(False)
+        try:
+            self.patterns_model.set_patterns(Pattern.get_all_patterns(), force)
+        finally:
+            self.patterns_table.setUpdatesEnabled(True)
+
+    def reload_patterns_list(self):
+        """Rebuild the patterns table even if no pattern was added or removed"""
+        self._force_reload = True
+        self.refresh_patterns_list()
+
+    def _on_button_clicked(self, row, column):
+        """Dispatch an Edit/Delete button click on the patterns table"""
+        if column == 3:
+            self.open_pattern_edit_dialog(self.patterns_model.pattern_at(row))
+        elif column == 4:
+            self.delete_pattern(self.patterns_model.index(row, column).data(Qt.UserRole))
 
     def open_pattern_edit_dialog(self, pattern):
         """Open dialog to edit an existing pattern"""
-        if pattern.pattern_type == "UniformExcitation":
-            dialog = UniformExcitationEditDialog(pattern, self)
-        elif pattern.pattern_type == "H5DRM":
-            dialog = H5DRMEditDialog(pattern, self)
-        else:
+        dialog_cls = _EDIT_DIALOGS.get(pattern.pattern_type.lower())
+        if dialog_cls is None:
             QMessageBox.warning(self, "Error", f"No edit dialog available for pattern type: {pattern.pattern_type}")
             return
         
+        dialog = dialog_cls(pattern, self)
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_patterns_list()
+            # Edits change parameters in place, so the rows compare unchanged
+            self.reload_patterns_list()
 
     def delete_pattern(self, tag):
         """Delete a pattern from the system"""
@@ -142,7 +421,12 @@ class PatternManagerTab(QDialog):
         )
         
         if reply == QMessageBox.Yes:
+            pattern = Pattern.get_all_patterns().get(tag)
             self.pattern_manager.remove_pattern(tag)
+            # Drop just this row; the refresh then only resets the table if
+            # the remaining patterns differ from what is shown
+            if pattern is not None:
+                self.patterns_model.remove_pattern(pattern)
             self.refresh_patterns_list()
 
 
@@ -151,9 +435,8 @@ class UniformExcitationCreationDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Create Uniform Excitation Pattern")
         self.pattern_manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-        self.time_series_manager = TimeSeriesManager(mesh_maker=MeshMaker.get_instance())
-        self.int_validator = IntValidator()
-        self.double_validator = DoubleValidator()
+        self.int_validator = _get_validator(IntValidator)
+        self.double_validator = _get_validator(DoubleValidator)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -168,7 +451,11 @@ class UniformExcitationCreationDialog(QDialog):
         
         # TimeSeries selection
         self.time_series_combo = QComboBox()
-        self.update_time_series_list()
+        self._ts_refresh_timer = QTimer(self)
+        self._ts_refresh_timer.setSingleShot(True)
+        self._ts_refresh_timer.setInterval(50)
+        self._ts_refresh_timer.timeout.connect(self._do_update_time_series_list)
+        self._do_update_time_series_list()
         form_layout.addRow("Time Series:", self.time_series_combo)
         
         # Time series management buttons
@@ -195,17 +482,9 @@ class UniformExcitationCreationDialog(QDialog):
         layout.addLayout(form_layout)
         
         # Add notes
-        notes_section = QTextEdit()
-        notes_section.setReadOnly(True)
-        notes_section.setPlainText(
-            "Notes:\n"
-            "- The DOF direction specifies the degrees of freedom affected by the motion\n"
-            "- For standard models: 1=X, 2=Y, 3=Z\n"
-            "- The responses obtained from the nodes are RELATIVE values\n"
-            "- Time Series defines the acceleration history\n"
-            "- Initial velocity allows setting a non-zero starting velocity\n"
-            "- Factor allows scaling the input motion"
-        )
+        notes_section = QLabel(_UNIFORM_EXCITATION_NOTES)
+        notes_section.setWordWrap(True)
+        notes_section.setTextInteractionFlags(Qt.TextSelectableByMouse)
         layout.addWidget(notes_section)
         
         # Buttons
@@ -219,18 +498,27 @@ class UniformExcitationCreationDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
 
+    def reset_fields(self):
+        """Restore the default inputs so the dialog can be reused"""
+        self.dof_input.clear()
+        self.vel0_input.setText("0.0")
+        self.factor_input.setText("1.0")
+        self._do_update_time_series_list()
+        self.time_series_combo.setCurrentIndex(0)
+
     def update_time_series_list(self):
+        """Schedule a time series dropdown update, coalescing repeated requests"""
+        self._ts_refresh_timer.start()
+
+    def _do_update_time_series_list(self):
         """Update the time series dropdown with current time series"""
-        self.time_series_combo.clear()
-        time_series_dict = TimeSeries.get_all_time_series()
-        
-        for tag, ts in time_series_dict.items():
-            self.time_series_combo.addItem(f"{ts.series_type} (Tag: {tag})", ts)
+        # Always rebuild: the combo lists the class-level TimeSeries registry,
+        # which series created outside this dialog's manager also populate
+        _fill_time_series_combo(self.time_series_combo, TimeSeries.get_all_time_series())
 
     def open_time_series_dialog(self):
         """Open dialog to create a new time series"""
-        from femora.components.TimeSeries.timeSeriesGUI import TimeSeriesManagerTab
-        dialog = TimeSeriesManagerTab(self)
+        dialog = _get_ts_tab()(self)
         if dialog.exec() == QDialog.Accepted:
             self.update_time_series_list()
 
@@ -246,8 +534,8 @@ class UniformExcitationCreationDialog(QDialog):
                 return
             
             # Get optional parameters
-            vel0 = float(self.vel0_input.text() or "0.0")
-            factor = float(self.factor_input.text() or "1.0")
+            vel0 = _parse_float(self.vel0_input.text(), 0.0)
+            factor = _parse_float(self.factor_input.text(), 1.0)
             
             # Create pattern
             pattern = self.pattern_manager.create_pattern(
@@ -271,10 +559,8 @@ class UniformExcitationEditDialog(QDialog):
         super().__init__(parent)
         self.pattern = pattern
         self.setWindowTitle(f"Edit Uniform Excitation Pattern (Tag: {pattern.tag})")
-        self.pattern_manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-        self.time_series_manager = TimeSeriesManager(mesh_maker=MeshMaker.get_instance())
-        self.int_validator = IntValidator()
-        self.double_validator = DoubleValidator()
+        self.int_validator = _get_validator(IntValidator)
+        self.double_validator = _get_validator(DoubleValidator)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -289,13 +575,16 @@ class UniformExcitationEditDialog(QDialog):
         
         # TimeSeries selection
         self.time_series_combo = QComboBox()
-        self.update_time_series_list()
+        self._ts_refresh_timer = QTimer(self)
+        self._ts_refresh_timer.setSingleShot(True)
+        self._ts_refresh_timer.setInterval(50)
+        self._ts_refresh_timer.timeout.connect(self._do_update_time_series_list)
+        self._ts_index_by_tag = {}
+        self._do_update_time_series_list()
         # Set current time series
-        for i in range(self.time_series_combo.count()):
-            ts = self.time_series_combo.itemData(i)
-            if ts and ts.tag == pattern.time_series.tag:
-                self.time_series_combo.setCurrentIndex(i)
-                break
+        self.time_series_combo.setCurrentIndex(
+            self._ts_index_by_tag.get(pattern.time_series.tag, 0)
+        )
         form_layout.addRow("Time Series:", self.time_series_combo)
         
         # Time series management buttons
@@ -333,27 +622,24 @@ class UniformExcitationEditDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def update_time_series_list(self):
+        """Schedule a time series dropdown update, coalescing repeated requests"""
+        self._ts_refresh_timer.start()
+
+    def _do_update_time_series_list(self):
         """Update the time series dropdown with current time series"""
+        # Always rebuild: the combo lists the class-level TimeSeries registry,
+        # which series created outside this dialog's manager also populate
         current_ts_tag = None
         if self.time_series_combo.currentData():
             current_ts_tag = self.time_series_combo.currentData().tag
         
-        self.time_series_combo.clear()
-        time_series_dict = TimeSeries.get_all_time_series()
-        
-        current_index = 0
-        for i, (tag, ts) in enumerate(time_series_dict.items()):
-            self.time_series_combo.addItem(f"{ts.series_type} (Tag: {tag})", ts)
-            if tag == current_ts_tag:
-                current_index = i
-        
-        if self.time_series_combo.count() > 0:
-            self.time_series_combo.setCurrentIndex(current_index)
+        self._ts_index_by_tag = _fill_time_series_combo(
+            self.time_series_combo, TimeSeries.get_all_time_series(), current_ts_tag
+        )
 
     def open_time_series_dialog(self):
         """Open dialog to create a new time series"""
-        from femora.components.TimeSeries.timeSeriesGUI import TimeSeriesManagerTab
-        dialog = TimeSeriesManagerTab(self)
+        dialog = _get_ts_tab()(self)
         if dialog.exec() == QDialog.Accepted:
             self.update_time_series_list()
 
@@ -369,8 +655,8 @@ class UniformExcitationEditDialog(QDialog):
                 return
             
             # Get optional parameters
-            vel0 = float(self.vel0_input.text() or "0.0")
-            factor = float(self.factor_input.text() or "1.0")
+            vel0 = _parse_float(self.vel0_input.text(), 0.0)
+            factor = _parse_float(self.factor_input.text(), 1.0)
             
             # Update pattern
             self.pattern.update_values(
@@ -388,96 +674,147 @@ class UniformExcitationEditDialog(QDialog):
             QMessageBox.critical(self, "Error", str(e))
 
 
+# Default H5DRM form values, as shown by the creation dialog
+_H5DRM_DEFAULTS = {
+    "filepath": "",
+    "factor": "1.0",
+    "crd_scale": "1.0",
+    "distance_tolerance": "0.001",
+    "do_coordinate_transformation": 0,
+    "transform_matrix": _IDENTITY_MATRIX_TEXTS,
+    "origin": ("0.0", "0.0", "0.0"),
+}
+
+
+def _h5drm_form_values(pattern):
+    """Return the H5DRM form values describing an existing pattern"""
+    return {
+        "filepath": pattern.filepath,
+        "factor": str(pattern.factor),
+        "crd_scale": str(pattern.crd_scale),
+        "distance_tolerance": str(pattern.distance_tolerance),
+        "do_coordinate_transformation": pattern.do_coordinate_transformation,
+        "transform_matrix": [str(value) for value in pattern.transform_matrix.ravel().tolist()],
+        "origin": [str(value) for value in pattern.origin.tolist()],
+    }
+
+
+def _build_h5drm_form(dialog, values):
+    """Build the H5DRM input form shared by the creation and edit dialogs.
+
+    Returns:
+        tuple: The scroll area holding the form, and a dict of its input
+        widgets keyed by parameter name. The matrix and origin entries are
+        lists of line edits.
+    """
+    validator = _get_validator(DoubleValidator)
+    widgets = {}
+    
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    form_widget = QWidget()
+    form_layout = QFormLayout(form_widget)
+    
+    # File path
+    filepath_input = QLineEdit()
+    file_layout = QHBoxLayout()
+    file_layout.addWidget(filepath_input)
+    browse_btn = QPushButton("Browse")
+    browse_btn.clicked.connect(dialog.browse_file)
+    file_layout.addWidget(browse_btn)
+    form_layout.addRow("H5DRM Dataset:", file_layout)
+    widgets["filepath"] = filepath_input
+    
+    # Factor, coordinate scale and distance tolerance
+    for name, label in (
+        ("factor", "Factor:"),
+        ("crd_scale", "Coordinate Scale:"),
+        ("distance_tolerance", "Distance Tolerance:"),
+    ):
+        input_field = QLineEdit()
+        input_field.setValidator(validator)
+        form_layout.addRow(label, input_field)
+        widgets[name] = input_field
+    
+    # Coordinate transformation
+    do_transform_combo = QComboBox()
+    do_transform_combo.addItem("0 - No Transformation", 0)
+    do_transform_combo.addItem("1 - Apply Transformation", 1)
+    form_layout.addRow("Apply Transformation:", do_transform_combo)
+    widgets["do_coordinate_transformation"] = do_transform_combo
+    
+    # Transformation matrix
+    form_layout.addRow(QLabel("Transformation Matrix:"))
+    matrix_layout = QGridLayout()
+    transform_inputs = []
+    for k in range(9):
+        input_field = QLineEdit()
+        input_field.setValidator(validator)
+        matrix_layout.addWidget(input_field, k // 3, k % 3)
+        transform_inputs.append(input_field)
+    form_layout.addRow(matrix_layout)
+    widgets["transform_matrix"] = transform_inputs
+    
+    # Origin
+    form_layout.addRow(QLabel("Origin Location:"))
+    origin_layout = QHBoxLayout()
+    origin_inputs = []
+    for label in _ORIGIN_LABELS:
+        origin_layout.addWidget(QLabel(label))
+        input_field = QLineEdit()
+        input_field.setValidator(validator)
+        origin_layout.addWidget(input_field)
+        origin_inputs.append(input_field)
+    form_layout.addRow(origin_layout)
+    widgets["origin"] = origin_inputs
+    
+    scroll.setWidget(form_widget)
+    _set_h5drm_form_values(widgets, values)
+    return scroll, widgets
+
+
+def _bind_h5drm_form(dialog, widgets):
+    """Expose the shared form widgets under the dialog's field attribute names"""
+    dialog.filepath_input = widgets["filepath"]
+    dialog.factor_input = widgets["factor"]
+    dialog.crd_scale_input = widgets["crd_scale"]
+    dialog.distance_tolerance_input = widgets["distance_tolerance"]
+    dialog.do_transform_combo = widgets["do_coordinate_transformation"]
+    dialog.transform_inputs = widgets["transform_matrix"]
+    dialog.origin_inputs = widgets["origin"]
+
+
+def _set_h5drm_form_values(widgets, values):
+    """Load H5DRM form values into widgets built by ``_build_h5drm_form``"""
+    widgets["filepath"].setText(values["filepath"])
+    for name in ("factor", "crd_scale", "distance_tolerance"):
+        widgets[name].setText(values[name])
+    combo = widgets["do_coordinate_transformation"]
+    combo.setCurrentIndex(max(combo.findData(values["do_coordinate_transformation"]), 0))
+    for input_field, text in zip(widgets["transform_matrix"], values["transform_matrix"]):
+        input_field.setText(text)
+    for input_field, text in zip(widgets["origin"], values["origin"]):
+        input_field.setText(text)
+
+
 class H5DRMCreationDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create H5DRM Pattern")
         self.pattern_manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-        self.double_validator = DoubleValidator()
-        self.int_validator = IntValidator()
         
         # Main layout
         layout = QVBoxLayout(self)
         
         # Input form within a scrollable area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        form_widget = QWidget()
-        form_layout = QFormLayout(form_widget)
-        
-        # File path
-        self.filepath_input = QLineEdit()
-        file_layout = QHBoxLayout()
-        file_layout.addWidget(self.filepath_input)
-        browse_btn = QPushButton("Browse")
-        browse_btn.clicked.connect(self.browse_file)
-        file_layout.addWidget(browse_btn)
-        form_layout.addRow("H5DRM Dataset:", file_layout)
-        
-        # Factor
-        self.factor_input = QLineEdit("1.0")
-        self.factor_input.setValidator(self.double_validator)
-        form_layout.addRow("Factor:", self.factor_input)
-        
-        # Coordinate scale
-        self.crd_scale_input = QLineEdit("1.0")
-        self.crd_scale_input.setValidator(self.double_validator)
-        form_layout.addRow("Coordinate Scale:", self.crd_scale_input)
-        
-        # Distance tolerance
-        self.distance_tolerance_input = QLineEdit("0.001")
-        self.distance_tolerance_input.setValidator(self.double_validator)
-        form_layout.addRow("Distance Tolerance:", self.distance_tolerance_input)
-        
-        # Coordinate transformation
-        self.do_transform_combo = QComboBox()
-        self.do_transform_combo.addItems(["0 - No Transformation", "1 - Apply Transformation"])
-        form_layout.addRow("Apply Transformation:", self.do_transform_combo)
-        
-        # Transformation matrix
-        form_layout.addRow(QLabel("Transformation Matrix:"))
-        
-        # Create a grid layout for the transformation matrix
-        matrix_layout = QGridLayout()
-        self.transform_inputs = []
-        for i in range(3):
-            for j in range(3):
-                input_field = QLineEdit("0.0")
-                if i == j:
-                    input_field.setText("1.0")  # Identity matrix by default
-                input_field.setValidator(self.double_validator)
-                matrix_layout.addWidget(input_field, i, j)
-                self.transform_inputs.append(input_field)
-        
-        form_layout.addRow(matrix_layout)
-        
-        # Origin
-        form_layout.addRow(QLabel("Origin Location:"))
-        origin_layout = QHBoxLayout()
-        self.origin_inputs = []
-        for label in ["X:", "Y:", "Z:"]:
-            origin_layout.addWidget(QLabel(label))
-            input_field = QLineEdit("0.0")
-            input_field.setValidator(self.double_validator)
-            origin_layout.addWidget(input_field)
-            self.origin_inputs.append(input_field)
-        
-        form_layout.addRow(origin_layout)
-        
-        scroll.setWidget(form_widget)
+        scroll, self._form_widgets = _build_h5drm_form(self, _H5DRM_DEFAULTS)
+        _bind_h5drm_form(self, self._form_widgets)
         layout.addWidget(scroll)
         
         # Add notes
-        notes_section = QTextEdit()
-        notes_section.setReadOnly(True)
-        notes_section.setPlainText(
-            "Notes:\n"
-            "- Factor: Scale DRM dataset displacements and accelerations\n"
-            "- Coordinate Scale: Scale coordinates for unit conversion\n"
-            "- Distance Tolerance: For DRM point to FE mesh matching\n"
-            "- Transformation Matrix: Applied to dataset coordinates\n"
-            "- Origin: Location after transformation"
-        )
+        notes_section = QLabel(_H5DRM_NOTES)
+        notes_section.setWordWrap(True)
+        notes_section.setTextInteractionFlags(Qt.TextSelectableByMouse)
         layout.addWidget(notes_section)
         
         # Buttons
@@ -491,9 +828,12 @@ class H5DRMCreationDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
 
+    def reset_fields(self):
+        """Restore the default inputs so the dialog can be reused"""
+        _set_h5drm_form_values(self._form_widgets, _H5DRM_DEFAULTS)
+
     def browse_file(self):
         """Open file browser to select H5DRM dataset file"""
-        from qtpy.QtWidgets import QFileDialog
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select H5DRM Dataset", "", "H5DRM Files (*.h5drm);;All Files (*)"
         )
@@ -512,17 +852,15 @@ class H5DRMCreationDialog(QDialog):
             crd_scale = float(self.crd_scale_input.text())
             distance_tolerance = float(self.distance_tolerance_input.text())
             
-            do_transform = int(self.do_transform_combo.currentText().split(" ")[0])
-            
-            # Get transformation matrix
-            transform_matrix = []
-            for input_field in self.transform_inputs:
-                transform_matrix.append(float(input_field.text()))
+            do_transform = self.do_transform_combo.currentData()
             
-            # Get origin
-            origin = []
-            for input_field in self.origin_inputs:
-                origin.append(float(input_field.text()))
+            # Get transformation matrix and origin
+            transform_matrix = np.array(
+                [input_field.text() for input_field in self.transform_inputs], dtype=np.float64
+            )
+            origin = np.array(
+                [input_field.text() for input_field in self.origin_inputs], dtype=np.float64
+            )
             
             # Create pattern
             pattern = self.pattern_manager.create_pattern(
@@ -549,78 +887,13 @@ class H5DRMEditDialog(QDialog):
         super().__init__(parent)
         self.pattern = pattern
         self.setWindowTitle(f"Edit H5DRM Pattern (Tag: {pattern.tag})")
-        self.pattern_manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-        self.double_validator = DoubleValidator()
-        self.int_validator = IntValidator()
         
         # Main layout
         layout = QVBoxLayout(self)
         
         # Input form within a scrollable area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        form_widget = QWidget()
-        form_layout = QFormLayout(form_widget)
-        
-        # File path
-        self.filepath_input = QLineEdit(pattern.filepath)
-        file_layout = QHBoxLayout()
-        file_layout.addWidget(self.filepath_input)
-        browse_btn = QPushButton("Browse")
-        browse_btn.clicked.connect(self.browse_file)
-        file_layout.addWidget(browse_btn)
-        form_layout.addRow("H5DRM Dataset:", file_layout)
-        
-        # Factor
-        self.factor_input = QLineEdit(str(pattern.factor))
-        self.factor_input.setValidator(self.double_validator)
-        form_layout.addRow("Factor:", self.factor_input)
-        
-        # Coordinate scale
-        self.crd_scale_input = QLineEdit(str(pattern.crd_scale))
-        self.crd_scale_input.setValidator(self.double_validator)
-        form_layout.addRow("Coordinate Scale:", self.crd_scale_input)
-        
-        # Distance tolerance
-        self.distance_tolerance_input = QLineEdit(str(pattern.distance_tolerance))
-        self.distance_tolerance_input.setValidator(self.double_validator)
-        form_layout.addRow("Distance Tolerance:", self.distance_tolerance_input)
-        
-        # Coordinate transformation
-        self.do_transform_combo = QComboBox()
-        self.do_transform_combo.addItems(["0 - No Transformation", "1 - Apply Transformation"])
-        self.do_transform_combo.setCurrentIndex(pattern.do_coordinate_transformation)
-        form_layout.addRow("Apply Transformation:", self.do_transform_combo)
-        
-        # Transformation matrix
-        form_layout.addRow(QLabel("Transformation Matrix:"))
-        
-        # Create a grid layout for the transformation matrix
-        matrix_layout = QGridLayout()
-        self.transform_inputs = []
-        for i in range(3):
-            for j in range(3):
-                input_field = QLineEdit(str(pattern.transform_matrix[i*3 + j]))
-                input_field.setValidator(self.double_validator)
-                matrix_layout.addWidget(input_field, i, j)
-                self.transform_inputs.append(input_field)
-        
-        form_layout.addRow(matrix_layout)
-        
-        # Origin
-        form_layout.addRow(QLabel("Origin Location:"))
-        origin_layout = QHBoxLayout()
-        self.origin_inputs = []
-        for idx, label in enumerate(["X:", "Y:", "Z:"]):
-            origin_layout.addWidget(QLabel(label))
-            input_field = QLineEdit(str(pattern.origin[idx]))
-            input_field.setValidator(self.double_validator)
-            origin_layout.addWidget(input_field)
-            self.origin_inputs.append(input_field)
-        
-        form_layout.addRow(origin_layout)
-        
-        scroll.setWidget(form_widget)
+        scroll, self._form_widgets = _build_h5drm_form(self, _h5drm_form_values(pattern))
+        _bind_h5drm_form(self, self._form_widgets)
         layout.addWidget(scroll)
         
         # Buttons
@@ -636,7 +909,6 @@ class H5DRMEditDialog(QDialog):
 
     def browse_file(self):
         """Open file browser to select H5DRM dataset file"""
-        from qtpy.QtWidgets import QFileDialog
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select H5DRM Dataset", "", "H5DRM Files (*.h5drm);;All Files (*)"
         )
@@ -655,17 +927,15 @@ class H5DRMEditDialog(QDialog):
             crd_scale = float(self.crd_scale_input.text())
             distance_tolerance = float(self.distance_tolerance_input.text())
             
-            do_transform = int(self.do_transform_combo.currentText().split(" ")[0])
+            do_transform = self.do_transform_combo.currentData()
             
-            # Get transformation matrix
-            transform_matrix = []
-            for input_field in self.transform_inputs:
-                transform_matrix.append(float(input_field.text()))
-            
-            # Get origin
-            origin = []
-            for input_field in self.origin_inputs:
-                origin.append(float(input_field.text()))
+            # Get transformation matrix and origin
+            transform_matrix = np.array(
+                [input_field.text() for input_field in self.transform_inputs], dtype=np.float64
+            )
+            origin = np.array(
+                [input_field.text() for input_field in self.origin_inputs], dtype=np.float64
+            )
             
             # Update pattern
             self.pattern.update_values(
@@ -686,6 +956,18 @@ class H5DRMEditDialog(QDialog):
             QMessageBox.critical(self, "Error", str(e))
 
 
+# Dialog classes per lower-cased pattern type; other modules may register more
+_CREATION_DIALOGS = {
+    "uniformexcitation": UniformExcitationCreationDialog,
+    "h5drm": H5DRMCreationDialog,
+}
+
+_EDIT_DIALOGS = {
+    "uniformexcitation": UniformExcitationEditDialog,
+    "h5drm": H5DRMEditDialog,
+}
+
+
 if __name__ == '__main__':
     from qtpy.QtWidgets import QApplication
     import sys
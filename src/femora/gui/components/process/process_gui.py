@@ -1,14 +1,23 @@
-# Suppress specific sipPyTypeDict deprecation warnings
+import struct
 import warnings
-warnings.filterwarnings("ignore", message="sipPyTypeDict\(\) is deprecated", category=DeprecationWarning)
+from weakref import WeakValueDictionary
 
-from qtpy.QtGui import QDrag, QPixmap, QColor, QPainter
+# Suppress sipPyTypeDict deprecation warnings raised while this module
+# subclasses Qt types, without silencing them for any other module
+warnings.filterwarnings(
+    "ignore",
+    message=r"sipPyTypeDict\(\) is deprecated",
+    category=DeprecationWarning,
+    module=__name__,
+)
+
+from qtpy.QtGui import QDrag, QPixmap, QColor, QPainter, QStaticText
 from qtpy.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, 
-    QListWidgetItem, QTabWidget, QDialog, QMessageBox, QMenu, QAction, 
+    QListWidgetItem, QListView, QTabWidget, QDialog, QMessageBox, QMenu, QAction, 
     QAbstractItemView, QFrame, QSplitter, QApplication
 )
-from qtpy.QtCore import Qt, QMimeData, QPoint
+from qtpy.QtCore import Qt, QAbstractListModel, QByteArray, QModelIndex, QMimeData, QPoint, QTimer
 
 from femora.core.process_manager import ProcessManager
 from femora.core.recorder_base import Recorder
@@ -19,24 +28,142 @@ from femora.components.Pattern.patternBase import Pattern, PatternManager
 from femora.components.MeshMaker import MeshMaker
 
 
-class ComponentDragItem(QListWidgetItem):
+# Component type -> (manager factory, tag resolver, step description)
+_COMPONENT_DISPATCH = {
+    "Analysis": (
+        lambda: AnalysisManager(),
+        lambda manager, tag: manager.get_analysis(tag),
+        lambda component: f"Analysis: {component.name} ({component.analysis_type})",
+    ),
+    "Recorder": (
+        lambda: RecorderManager(),
+        lambda manager, tag: manager.get_recorder(tag),
+        lambda component: f"Recorder: {component.recorder_type}",
+    ),
+    "Pattern": (
+        lambda: PatternManager(mesh_maker=MeshMaker.get_instance()),
+        lambda manager, tag: manager.get_pattern(tag),
+        lambda component: f"Pattern: {component.pattern_type}",
+    ),
+}
+
+
+def _lookup_component(cache, manager, component_type, tag):
+    """Return the component for tag, memoised in a WeakValueDictionary"""
+    key = (component_type, tag)
+    component = cache.get(key)
+    # A cached component that was removed or retagged no longer matches tag
+    if component is None or getattr(component, "tag", tag) != tag:
+        component = _COMPONENT_DISPATCH[component_type][1](manager, tag)
+        if component is not None:
+            cache[key] = component
+    return component
+
+
+# Drag payload: component type index and tag packed as "<Bi"
+_COMPONENT_MIME_TYPE = "application/x-femora-component"
+_COMPONENT_TYPES = tuple(_COMPONENT_DISPATCH)
+_COMPONENT_TYPE_IDS = {component_type: i for i, component_type in enumerate(_COMPONENT_TYPES)}
+_COMPONENT_STRUCT = struct.Struct("<Bi")
+
+
+def _component_mime_data(component_type, tag):
+    """Return drag data for a component in structured and plain text form"""
+    mimeData = QMimeData()
+    mimeData.setData(
+        _COMPONENT_MIME_TYPE,
+        QByteArray(_COMPONENT_STRUCT.pack(_COMPONENT_TYPE_IDS[component_type], tag)),
+    )
+    mimeData.setText(f"{component_type}:{tag}")
+    return mimeData
+
+
+def _read_component_mime_data(mimeData):
+    """Return (component_type, tag) carried by drag data, or None"""
+    if mimeData.hasFormat(_COMPONENT_MIME_TYPE):
+        type_id, tag = _COMPONENT_STRUCT.unpack(bytes(mimeData.data(_COMPONENT_MIME_TYPE)))
+        return _COMPONENT_TYPES[type_id], tag
+    if mimeData.hasText():
+        # Plain "Type:tag" text from older drag sources
+        component_type, _, tag = mimeData.text().partition(':')
+        if tag.isdigit():
+            return component_type, int(tag)
+    return None
+
+
+def _configure_list_layout(view):
+    """Lay out single-line rows in batches without measuring each one"""
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(100)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+
+class ComponentListModel(QAbstractListModel):
     """
-    Custom list item that can be dragged for components
+    List model of the (tag, name) pairs for one component type
     """
-    def __init__(self, tag, component_type, name, parent=None):
-        super().__init__(f"{name} (Tag: {tag})", parent)
-        self.tag = tag
+    def __init__(self, component_type, parent=None):
+        super().__init__(parent)
         self.component_type = component_type
-        self.setToolTip(f"Drag to add {component_type} with tag {tag} to process")
-        
+        self._entries = []
 
-class ComponentListWidget(QListWidget):
+    def set_entries(self, entries):
+        """Replace the listed (tag, name) pairs with as few model signals as possible"""
+        entries = list(entries)
+        old_count = len(self._entries)
+        if entries == self._entries:
+            return
+        if len(entries) > old_count and entries[:old_count] == self._entries:
+            # Only new components were appended: one rowsInserted keeps the selection
+            self.beginInsertRows(QModelIndex(), old_count, len(entries) - 1)
+            self._entries = entries
+            self.endInsertRows()
+            return
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def tag_at(self, row):
+        """Return the component tag shown in row"""
+        return self._entries[row][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        tag, name = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{name} (Tag: {tag})"
+        if role == Qt.ToolTipRole:
+            return f"Drag to add {self.component_type} with tag {tag} to process"
+        if role == Qt.UserRole:
+            return tag
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self):
+        return [_COMPONENT_MIME_TYPE, "text/plain"]
+
+    def mimeData(self, indexes):
+        if not indexes:
+            return QMimeData()
+        return _component_mime_data(self.component_type, self.tag_at(indexes[0].row()))
+
+
+class ComponentListWidget(QListView):
     """
-    List widget that supports drag operations for components
+    List view that supports drag operations for components
     """
     def __init__(self, component_type, parent=None):
         """
-        Initialize component list widget
+        Initialize component list view
         
         Args:
             component_type (str): Type of component ('Analysis', 'Recorder' or 'Pattern')
@@ -44,39 +171,60 @@ class ComponentListWidget(QListWidget):
         """
         super().__init__(parent)
         self.component_type = component_type
+        self.components_model = ComponentListModel(component_type, self)
+        self.setModel(self.components_model)
+        # Drag icon and the tag it currently shows, painted on first drag
+        self._drag_pixmap = None
+        self._drag_pixmap_tag = None
+        self._drag_text = QStaticText()
         self.setDragEnabled(True)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
+        _configure_list_layout(self)
+
+    def selected_tag(self):
+        """Return the tag of the selected component, or None"""
+        indexes = self.selectedIndexes()
+        if not indexes:
+            return None
+        return self.components_model.tag_at(indexes[0].row())
         
     def startDrag(self, supportedActions):
         """
         Start drag operation when item is dragged
         """
-        item = self.currentItem()
-        if not item:
+        index = self.currentIndex()
+        if not index.isValid():
             return
+        tag = self.components_model.tag_at(index.row())
             
-        # Create mime data
-        mimeData = QMimeData()
-        mimeData.setText(f"{self.component_type}:{item.tag}")
-        
         # Create drag object
         drag = QDrag(self)
-        drag.setMimeData(mimeData)
+        drag.setMimeData(self.components_model.mimeData([index]))
+        
+        drag.setPixmap(self._drag_pixmap_for(tag))
+        drag.setHotSpot(QPoint(10, 15))
         
-        # Create a pixmap for the drag icon
-        pixmap = QPixmap(200, 30)
+        # Execute drag - Replace exec_ with exec to fix deprecation warning
+        result = drag.exec(Qt.CopyAction)
+
+    def _drag_pixmap_for(self, tag):
+        """Return the drag icon for tag, repainting only when the tag changes"""
+        pixmap = self._drag_pixmap
+        if pixmap is not None and self._drag_pixmap_tag == tag:
+            return pixmap
+
+        if pixmap is None:
+            pixmap = self._drag_pixmap = QPixmap(200, 30)
         pixmap.fill(QColor(230, 230, 250))  # Light lavender color
         
-        # Add text to the pixmap
+        # Add text to the pixmap; QStaticText keeps its glyph layout between drags
+        self._drag_text.setText(f"{self.component_type}: {tag}")
         painter = QPainter(pixmap)
-        painter.drawText(10, 20, f"{self.component_type}: {item.tag}")
+        painter.drawStaticText(10, 20 - painter.fontMetrics().ascent(), self._drag_text)
         painter.end()
         
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(QPoint(10, 15))
-        
-        # Execute drag - Replace exec_ with exec to fix deprecation warning
-        result = drag.exec(Qt.CopyAction)
+        self._drag_pixmap_tag = tag
+        return pixmap
 
 
 class ProcessListWidget(QListWidget):
@@ -88,94 +236,128 @@ class ProcessListWidget(QListWidget):
         self.process_manager = MeshMaker.get_instance().process
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.DropOnly)
+        self.setDefaultDropAction(Qt.CopyAction)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)  # Allow multiple selection
-        
-        # Enable context menu
+        _configure_list_layout(self)
+        self._refresh_pending = False
+        self._refresh_on_show = False
+        self._managers = {
+            component_type: create_manager()
+            for component_type, (create_manager, _, _) in _COMPONENT_DISPATCH.items()
+        }
+        self._resolve_cache = WeakValueDictionary()
+        
+        # Enable context menu, built once and reused on every right-click
+        self._ctx_menu = QMenu(self)
+        self._remove_action = QAction("Remove from process", self)
+        self._remove_action.triggered.connect(self.remove_selected_steps)
+        self._ctx_menu.addAction(self._remove_action)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
     
     def dragEnterEvent(self, event):
         """Accept drag events from component lists"""
-        if event.mimeData().hasText():
+        mimeData = event.mimeData()
+        if mimeData.hasFormat(_COMPONENT_MIME_TYPE) or mimeData.hasText():
             event.acceptProposedAction()
     
-    def dragMoveEvent(self, event):
-        """Accept move events for component drops"""
-        if event.mimeData().hasText():
-            event.acceptProposedAction()
+    def mimeTypes(self):
+        """Formats accepted by Qt's own drag move handling"""
+        return [_COMPONENT_MIME_TYPE, "text/plain"]
     
     def dropEvent(self, event):
         """Handle drop events to add components to process"""
-        if event.mimeData().hasText():
-            text = event.mimeData().text()
-            component_type, tag = text.split(':')
-            tag = int(tag)
+        dropped = _read_component_mime_data(event.mimeData())
+        if dropped is not None:
+            component_type, tag = dropped
             
             # Get the component based on type
             component = None
-            description = ""
-            
-            if component_type == "Analysis":
-                component = AnalysisManager().get_analysis(tag)
-                description = f"Analysis: {component.name} ({component.analysis_type})"
-            elif component_type == "Recorder":
-                component = RecorderManager().get_recorder(tag)
-                description = f"Recorder: {component.recorder_type}"
-            elif component_type == "Pattern":
-                component = PatternManager(mesh_maker=MeshMaker.get_instance()).get_pattern(tag)
-                description = f"Pattern: {component.pattern_type}"
+            if component_type in self._managers:
+                component = _lookup_component(
+                    self._resolve_cache, self._managers[component_type], component_type, tag
+                )
             
             if component:
+                description = _COMPONENT_DISPATCH[component_type][2](component)
                 # Add to process manager
                 self.process_manager.add_step(component, description)
                 
-                # Refresh the list
-                self.refresh_process_list()
+                # Refresh once after a burst of drops
+                self._schedule_refresh()
             
             event.acceptProposedAction()
+
+    def _schedule_refresh(self):
+        """Queue a single refresh for the next event loop iteration"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the refresh queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self.refresh_process_list()
     
     def refresh_process_list(self):
-        """Refresh the process steps list"""
-        self.clear()
-        
-        # Add each step from the process manager
-        for i, step in enumerate(self.process_manager.get_steps()):
-            component_ref = step["component"]
-            component = component_ref()  # Get the actual component from weak reference
-            
-            if component:
-                # Create list item
-                description = step["description"] or f"Step {i+1}"
-                item = QListWidgetItem(f"{i+1}. {description}")
-                item.setToolTip(f"Step {i+1}: {description}")
+        """Refresh the process steps list, touching only rows that changed"""
+        if not self.isVisible():
+            # Nobody sees the list; rebuild it when it is shown
+            self._refresh_on_show = True
+            return
+        self._refresh_on_show = False
+
+        # Drop steps whose component was released so rows match step indices
+        self.process_manager.compact()
+        # One string per row serves as both text and tooltip
+        texts = [
+            f"{i}. {step.description or f'Step {i}'}"
+            for i, step in enumerate(self.process_manager.get_steps(), start=1)
+        ]
+
+        self.setUpdatesEnabled(False)
+        try:
+            # Update rows that exist in both lists
+            for row in range(min(self.count(), len(texts))):
+                item = self.item(row)
+                text = texts[row]
+                if item.text() != text:
+                    item.setText(text)
+                    item.setToolTip(text)
+
+            # Append new rows, then drop any left over from a longer list
+            for text in texts[self.count():]:
+                item = QListWidgetItem(text)
+                item.setToolTip(text)
                 self.addItem(item)
+            while self.count() > len(texts):
+                self.takeItem(self.count() - 1)
+        finally:
+            self.setUpdatesEnabled(True)
     
+    def showEvent(self, event):
+        """Apply a refresh that was skipped while the list was hidden"""
+        super().showEvent(event)
+        if self._refresh_on_show:
+            self.refresh_process_list()
+
     def show_context_menu(self, position):
         """Show context menu for process items"""
-        # Get selected items
-        selected_items = self.selectedItems()
-        if not selected_items:
+        if not self.selectedIndexes():
             return
         
-        # Create menu
-        menu = QMenu()
-        remove_action = QAction("Remove from process", self)
-        remove_action.triggered.connect(self.remove_selected_steps)
-        menu.addAction(remove_action)
-        
-        # Execute menu
-        menu.exec(self.mapToGlobal(position))
+        # Show the menu without a nested event loop; the action calls back
+        self._ctx_menu.popup(self.mapToGlobal(position))
     
     def remove_selected_steps(self):
         """Remove selected steps from the process"""
-        # Get selected rows in reverse order (to avoid index shifting when removing)
-        selected_rows = sorted([self.row(item) for item in self.selectedItems()], reverse=True)
+        selected_rows = [index.row() for index in self.selectedIndexes()]
         
         if not selected_rows:
             return
             
-        for row in selected_rows:
-            self.process_manager.remove_step(row)
+        self.process_manager.remove_steps(selected_rows)
         
         # Refresh list
         self.refresh_process_list()
@@ -203,6 +385,15 @@ class ProcessTab(QWidget):
         """
         super().__init__(parent)
         self.component_type = component_type
+        self._manager = _COMPONENT_DISPATCH[component_type][0]()
+        self._resolve_cache = WeakValueDictionary()
+
+        # Coalesce bursts of refresh requests into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh_components)
+
         self.init_ui()
     
     def init_ui(self):
@@ -228,58 +419,41 @@ class ProcessTab(QWidget):
         layout.addWidget(add_btn)
         
         # Initial refresh
-        self.refresh_components()
+        self._do_refresh_components()
     
     def refresh_components(self):
+        """Schedule a refresh of the components list"""
+        self._refresh_timer.start()
+
+    def _do_refresh_components(self):
         """Refresh the components list"""
-        self.component_list.clear()
-        
+        self._resolve_cache.clear()
+        manager = self._manager
         if self.component_type == "Analysis":
             # Get analyses from the manager
-            manager = AnalysisManager()
-            for tag, analysis in manager.get_all_analyses().items():
-                item = ComponentDragItem(tag, self.component_type, analysis.name)
-                self.component_list.addItem(item)
-        
+            entries = [(tag, analysis.name) for tag, analysis in manager.get_all_analyses().items()]
         elif self.component_type == "Recorder":
             # Get recorders from the manager
-            manager = RecorderManager()
-            for tag, recorder in manager.get_all_recorders().items():
-                item = ComponentDragItem(tag, self.component_type, recorder.recorder_type)
-                self.component_list.addItem(item)
-        
+            entries = [(tag, recorder.recorder_type) for tag, recorder in manager.get_all_recorders().items()]
         elif self.component_type == "Pattern":
             # Get patterns from the manager
-            manager = PatternManager(mesh_maker=MeshMaker.get_instance())
-            for tag, pattern in manager.get_all_patterns().items():
-                item = ComponentDragItem(tag, self.component_type, pattern.pattern_type)
-                self.component_list.addItem(item)
+            entries = [(tag, pattern.pattern_type) for tag, pattern in manager.get_all_patterns().items()]
+        else:
+            entries = []
+        self.component_list.components_model.set_entries(entries)
     
     def add_to_process(self):
         """Add selected component to process (alternative to drag-and-drop)"""
-        selected_items = self.component_list.selectedItems()
-        if not selected_items:
+        tag = self.component_list.selected_tag()
+        if tag is None:
             QMessageBox.warning(self, "Selection Error", f"Please select a {self.component_type} to add to process")
             return
         
-        item = selected_items[0]
-        tag = item.tag
-        
         # Get component
-        component = None
-        description = ""
-        
-        if self.component_type == "Analysis":
-            component = AnalysisManager().get_analysis(tag)
-            description = f"Analysis: {component.name} ({component.analysis_type})"
-        elif self.component_type == "Recorder":
-            component = RecorderManager().get_recorder(tag)
-            description = f"Recorder: {component.recorder_type}"
-        elif self.component_type == "Pattern":
-            component = PatternManager(mesh_maker=MeshMaker.get_instance()).get_pattern(tag)
-            description = f"Pattern: {component.pattern_type}"
+        component = _lookup_component(self._resolve_cache, self._manager, self.component_type, tag)
         
         if component:
+            description = _COMPONENT_DISPATCH[self.component_type][2](component)
             # Add to process manager
             MeshMaker.get_instance().process.add_step(component, description)
             
@@ -293,6 +467,10 @@ class ProcessGUI(QDialog):
     """
     Main dialog for process management GUI
     """
+    # (component type, tab label) in tab order
+    _TAB_SPECS = (("Analysis", "Analysis"), ("Recorder", "Recorders"), ("Pattern", "Patterns"))
+    _TAB_ATTRIBUTES = {"Analysis": "analysis_tab", "Recorder": "recorder_tab", "Pattern": "pattern_tab"}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Process Manager")
@@ -315,14 +493,14 @@ class ProcessGUI(QDialog):
         # Create tabs for different component types
         self.tabs = QTabWidget()
         
-        # Add tabs for component types
-        self.analysis_tab = ProcessTab("Analysis")
-        self.recorder_tab = ProcessTab("Recorder")
-        self.pattern_tab = ProcessTab("Pattern")
-        
-        self.tabs.addTab(self.analysis_tab, "Analysis")
-        self.tabs.addTab(self.recorder_tab, "Recorders")
-        self.tabs.addTab(self.pattern_tab, "Patterns")
+        # Add placeholder tabs; each ProcessTab is built when first shown
+        self.analysis_tab = None
+        self.recorder_tab = None
+        self.pattern_tab = None
+        for _, label in self._TAB_SPECS:
+            self.tabs.addTab(QWidget(), label)
+        self._build_tab(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._build_tab)
         
         top_layout.addWidget(self.tabs)
         
@@ -362,6 +540,27 @@ class ProcessGUI(QDialog):
         # Initial refresh
         self.refresh_process_panel()
     
+    def _build_tab(self, index):
+        """Replace the placeholder at index with its ProcessTab on first use"""
+        if index < 0:
+            return
+        component_type, label = self._TAB_SPECS[index]
+        attribute = self._TAB_ATTRIBUTES[component_type]
+        if getattr(self, attribute) is not None:
+            return
+
+        tab = ProcessTab(component_type)
+        setattr(self, attribute, tab)
+        self.tabs.blockSignals(True)
+        try:
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, label)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     def refresh_process_panel(self):
         """Refresh the process steps list"""
         self.process_list.refresh_process_list()
@@ -280,10 +280,10 @@ def _resolve_process_component(component_ref: Any) -> Any:
 def _serialize_process(process: Any) -> Dict[str, Any]:
     steps: List[Dict[str, Any]] = []
     for index, step in enumerate(getattr(process, "steps", [])):
-        component = _resolve_process_component(step.get("component"))
+        component = _resolve_process_component(step.component)
         step_data: Dict[str, Any] = {
             "index": index,
-            "description": step.get("description", "") or "",
+            "description": step.description or "",
         }
         if component is None:
             step_data["type"] = "Unknown"
@@ -440,7 +440,8 @@ def export_to_tcl(model, filename=None, progress_callback=None, decimals=5):
             f.write("\n# Process ======================================\n")
             indx = 1
             size = len(model.process)
-            f.write(f"{model.process.to_tcl()}\n")
+            model.process.write_tcl(f)
+            f.write("\n")
 
             f.write("exit\n")
             # for process in model.process:
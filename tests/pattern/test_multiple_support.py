@@ -61,3 +61,12 @@ def test_multiple_support_includes_interpolated_dependencies_first(managers):
             "}",
         ]
     )
+
+
+def test_imposed_motion_uses_slots(managers):
+    time_series, ground_motions, patterns = managers
+    ground_motion = ground_motions.plain(accel=time_series.constant())
+    imposed = patterns.multiple_support().add_imposed_motion(
+        node_tag=1, dof=1, ground_motion=ground_motion
+    )
+    assert not hasattr(imposed, "__dict__")
@@ -0,0 +1,221 @@
+# =============================================================================
+# Femora: Fast Efficient Meta-modeling for OpenSees-based Resilience Analysis
+# Copyright 2026 Amin Pakzad and Pedro Arduino
+# Developed at the UW Geotechnical Lab
+# SPDX-License-Identifier: Apache-2.0
+# =============================================================================
+
+import weakref
+
+import numpy as np
+import pytest
+
+from femora.core.model import Model
+
+
+@pytest.fixture
+def mesh_maker():
+    mk = Model()
+    mk.clear_model()
+    yield mk
+    mk.clear_model()
+
+
+def _build_patterns(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    return [
+        mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts),
+        mesh_maker.pattern.plain(time_series=ts),
+        mesh_maker.pattern.h5drm(
+            filepath="drm.h5drm",
+            factor=1.0,
+            crd_scale=1.0,
+            distance_tolerance=1.0e-3,
+            do_coordinate_transformation=0,
+            transform_matrix=[1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+            origin=[0.0, 0.0, 0.0],
+        ),
+        mesh_maker.pattern.multiple_support(),
+    ]
+
+
+def test_patterns_use_slots_and_support_weakrefs(mesh_maker):
+    for pattern in _build_patterns(mesh_maker):
+        assert not hasattr(pattern, "__dict__")
+        assert weakref.ref(pattern)() is pattern
+        with pytest.raises(AttributeError):
+            pattern.undeclared_attribute = 1
+
+
+def test_uniform_excitation_to_tcl_optional_flags(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    plain = mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts)
+    full = mesh_maker.pattern.uniform_excitation(dof=2, time_series=ts, vel0=0.5, factor=9.81)
+
+    assert plain.to_tcl() == "pattern UniformExcitation 1 1 -accel 1"
+    assert full.to_tcl() == "pattern UniformExcitation 2 2 -accel 1 -vel0 0.5 -fact 9.81"
+
+
+def test_cached_pattern_tcl_tracks_tags_and_attribute_changes(mesh_maker):
+    ts_first = mesh_maker.time_series.constant()
+    ts = mesh_maker.time_series.constant()
+    first = mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts)
+    pattern = mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts)
+    assert pattern.to_tcl() == "pattern UniformExcitation 2 1 -accel 2"
+    assert pattern.to_tcl() is pattern.to_tcl()
+
+    mesh_maker.pattern.remove(first.tag)
+    mesh_maker.time_series.remove(ts_first.tag)
+    assert pattern.to_tcl() == "pattern UniformExcitation 1 1 -accel 1"
+
+    pattern.factor = 2.0
+    assert pattern.to_tcl() == "pattern UniformExcitation 1 1 -accel 1 -fact 2.0"
+
+
+def test_h5drm_stores_contiguous_float64_arrays(mesh_maker):
+    pattern = mesh_maker.pattern.h5drm(
+        filepath="drm.h5drm",
+        factor=1.0,
+        crd_scale=1.0,
+        distance_tolerance=1.0e-3,
+        do_coordinate_transformation=1,
+        T00=0, T01=1, T02=0, T10=-1, T11=0, T12=0, T20=0, T21=0, T22=1,
+        x00=1, x01=2, x02=3,
+    )
+    assert pattern.transform_matrix.shape == (9,)
+    assert pattern.transform_matrix.dtype == np.float64
+    assert pattern.transform_matrix.flags.c_contiguous
+    assert pattern.origin.shape == (3,)
+    assert pattern.to_tcl() == (
+        'pattern H5DRM 1 "drm.h5drm" 1.0 1.0 0.001 1 '
+        "0.0 1.0 0.0 -1.0 0.0 0.0 0.0 0.0 1.0 1.0 2.0 3.0"
+    )
+
+    pattern.transform_matrix[0] = 2.0
+    assert pattern.to_tcl().endswith("2.0 1.0 0.0 -1.0 0.0 0.0 0.0 0.0 1.0 1.0 2.0 3.0")
+
+    with pytest.raises(ValueError):
+        mesh_maker.pattern.h5drm("drm.h5drm", 1.0, 1.0, 1.0e-3, 0, [1.0] * 8, [0.0] * 3)
+
+    pattern.transform_matrix = np.eye(3)
+    pattern.origin = (4, 5, 6)
+    assert pattern.transform_matrix.shape == (9,)
+    assert pattern.origin.dtype == np.float64
+    assert pattern.to_tcl().endswith("1.0 0.0 0.0 0.0 1.0 0.0 0.0 0.0 1.0 4.0 5.0 6.0")
+    with pytest.raises(ValueError):
+        pattern.origin = [0.0, 0.0]
+
+
+def test_plain_pattern_remove_and_clear_loads_detach(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.plain(time_series=ts)
+    first = pattern.add_load.node(node_tag=1, values=[1.0, 0.0, 0.0])
+    second = pattern.add_load.node(node_tag=2, values=[0.0, 1.0, 0.0])
+
+    pattern.remove_load(first)
+    pattern.remove_load(first)
+    assert first.pattern_tag is None
+    assert pattern.get_loads() == [second]
+
+    pattern.clear_loads()
+    assert second.pattern_tag is None
+    assert pattern.get_loads() == []
+
+
+def test_uniform_excitation_coerces_and_rejects_dof(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.uniform_excitation(dof=np.int64(3), time_series=ts, factor=2)
+    assert type(pattern.dof) is int and pattern.dof == 3
+    assert type(pattern.factor) is float
+    assert mesh_maker.pattern.uniform_excitation(dof=True, time_series=ts).dof == 1
+
+    for bad in (None, "x", 0, float("inf")):
+        with pytest.raises(ValueError):
+            mesh_maker.pattern.uniform_excitation(dof=bad, time_series=ts)
+    with pytest.raises(ValueError, match="factor must be a number"):
+        mesh_maker.pattern.plain(time_series=ts, factor=10**400)
+
+
+def test_h5drm_reports_all_missing_matrix_entries(mesh_maker):
+    with pytest.raises(KeyError, match=r"\['T21', 'T22'\]"):
+        mesh_maker.pattern.h5drm(
+            filepath="drm.h5drm",
+            factor=1.0,
+            crd_scale=1.0,
+            distance_tolerance=1.0e-3,
+            do_coordinate_transformation=0,
+            T00=1, T01=0, T02=0, T10=0, T11=1, T12=0, T20=0,
+            origin=[0.0, 0.0, 0.0],
+        )
+
+
+def test_removed_pattern_drops_cached_tcl(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts)
+    pattern.to_tcl()
+    mesh_maker.pattern.remove(pattern.tag)
+    assert pattern._tcl_cache is None
+    with pytest.raises(ValueError):
+        pattern.to_tcl()
+
+
+@pytest.mark.parametrize(
+    "transform_matrix, origin",
+    [
+        ([None] * 9, [0.0, 0.0, 0.0]),
+        ([1.0, "a", 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0], [0.0, 0.0, 0.0]),
+        ([1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0], [0.0, 0.0]),
+    ],
+)
+def test_h5drm_rejects_invalid_numeric_blocks(mesh_maker, transform_matrix, origin):
+    with pytest.raises(ValueError):
+        mesh_maker.pattern.h5drm("drm.h5drm", 1.0, 1.0, 1.0e-3, 1, transform_matrix, origin)
+
+
+def test_plain_pattern_to_tcl_block(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.plain(time_series=ts, factor=2.0)
+    assert pattern.to_tcl() == "pattern Plain 1 1 -fact 2.0 {\n}"
+
+    pattern.add_load.node(node_tag=1, values=[1.0, 0.0])
+    pattern.add_load.sp(node_tag=2, dof=1, value=0.5)
+    assert pattern.to_tcl() == "\n".join(
+        [
+            "pattern Plain 1 1 -fact 2.0 {",
+            "\tif {($pid == 0)} { load 1 1.0 0.0 }",
+            "\t" + pattern.get_loads()[1].to_tcl(),
+            "}",
+        ]
+    )
+
+
+def test_plain_pattern_attaches_each_load_once_in_order(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.plain(time_series=ts)
+    loads = [mesh_maker.load.node(node_tag=tag, values=[1.0]) for tag in (3, 1, 2)]
+    for load in loads + loads:
+        pattern.add_load_instance(load)
+    assert pattern.get_loads() == loads
+    pattern.remove_load(loads[1])
+    assert pattern.get_loads() == [loads[0], loads[2]]
+
+
+def test_pattern_scalar_parameters_report_invalid_numbers(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    with pytest.raises(ValueError, match="factor must be a number"):
+        mesh_maker.pattern.plain(time_series=ts, factor=None)
+    with pytest.raises(ValueError, match="vel0 must be a number"):
+        mesh_maker.pattern.uniform_excitation(dof=1, time_series=ts, vel0="fast")
+    with pytest.raises(ValueError, match="crd_scale must be a number"):
+        mesh_maker.pattern.h5drm("drm.h5drm", 1.0, "x", 1.0e-3, 0, [0.0] * 9, [0.0] * 3)
+
+
+def test_plain_pattern_reuses_add_load_proxy(mesh_maker):
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.plain(time_series=ts)
+    proxy = pattern.add_load
+    assert pattern.add_load is proxy
+    assert not hasattr(proxy, "__dict__")
+    proxy.node(node_tag=1, values=[1.0])
+    proxy.sp(node_tag=1, dof=1, value=0.0)
+    assert len(pattern.get_loads()) == 2
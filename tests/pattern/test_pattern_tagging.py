@@ -93,3 +93,38 @@ def test_pattern_tagging_with_deletions_and_start_tag_change(manager):
     # Existing p4 is retagged to 202, so the next tag should be 203.
     p5 = manager.add(DummyPattern('Uniform'))
     assert p5.tag == 203
+
+def test_pattern_retag_follows_tag_order_not_insertion_order(manager):
+    late = DummyPattern('Uniform')
+    late.tag = 7
+    manager.add(late)
+    early = DummyPattern('Uniform')
+    early.tag = 3
+    manager.add(early)
+    p3 = manager.add(DummyPattern('Uniform'))
+    assert p3.tag == 1
+    manager.set_tag_start(10)
+    assert p3.tag == 10
+    assert early.tag == 11
+    assert late.tag == 12
+
+def test_pattern_remove_renumbers_only_the_tail(manager):
+    patterns = [manager.add(DummyPattern('Uniform')) for _ in range(5)]
+    manager.remove(patterns[2].tag)
+    assert list(manager.get_all()) == [1, 2, 3, 4]
+    assert [manager.get(tag) for tag in range(1, 5)] == [
+        patterns[0], patterns[1], patterns[3], patterns[4]
+    ]
+    manager.remove(patterns[4].tag)
+    assert patterns[3].tag == 3
+    assert list(manager.get_all()) == [1, 2, 3]
+
+def test_pattern_next_tag_skips_preassigned_tags(manager):
+    preassigned = DummyPattern('Uniform')
+    preassigned.tag = 2
+    manager.add(preassigned)
+    p1 = manager.add(DummyPattern('Uniform'))
+    p3 = manager.add(DummyPattern('Uniform'))
+    assert (p1.tag, preassigned.tag, p3.tag) == (1, 2, 3)
+    manager.clear()
+    assert manager.add(DummyPattern('Uniform')).tag == 1
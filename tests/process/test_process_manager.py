@@ -95,3 +95,73 @@ def test_femora_module_does_not_expose_default_process_manager():
     import femora
 
     assert not hasattr(femora, "process")
+
+
+def test_process_write_tcl_matches_to_tcl(mesh_maker):
+    import io
+
+    mesh_maker.process.add_step(mesh_maker.actions.tcl("puts first"), description="First")
+    mesh_maker.process.add_step(mesh_maker.actions.tcl("puts second"), description="Second")
+
+    buffer = io.StringIO()
+    mesh_maker.process.write_tcl(buffer)
+    assert buffer.getvalue() == mesh_maker.process.to_tcl()
+    assert buffer.getvalue() == (
+        "# First ======================================\n\nputs first\n\n\n"
+        "# Second ======================================\n\nputs second\n\n\n"
+    )
+
+
+def test_process_steps_are_slotted_with_mapping_access(mesh_maker):
+    from femora.core.process_manager import Step
+
+    action = mesh_maker.actions.reset()
+    mesh_maker.process.add_step(action, description="Reset")
+    step = mesh_maker.process.get_step(0)
+
+    assert isinstance(step, Step)
+    assert not hasattr(step, "__dict__")
+    assert step.component is action
+    assert step["description"] == step.description == "Reset"
+    assert step.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        step["missing"]
+
+
+def test_process_skips_and_compacts_released_components(mesh_maker):
+    import gc
+
+    ts = mesh_maker.time_series.constant()
+    pattern = mesh_maker.pattern.plain(time_series=ts)
+    mesh_maker.process.add_step(mesh_maker.actions.tcl("puts before"), description="Before")
+    mesh_maker.process.add_step(pattern, description="Pattern")
+    mesh_maker.process.add_step(mesh_maker.actions.tcl("puts after"), description="After")
+    mesh_maker.process.current_step = 2
+
+    mesh_maker.pattern.remove(pattern.tag)
+    del pattern
+    gc.collect()
+
+    tcl = mesh_maker.process.to_tcl()
+    assert "puts before" in tcl and "puts after" in tcl
+    assert "# Pattern" not in tcl
+
+    steps = mesh_maker.process.get_steps()
+    assert mesh_maker.process.compact() == 1
+    assert mesh_maker.process.get_steps() is steps
+    assert [step.description for step in mesh_maker.process] == ["Before", "After"]
+    assert mesh_maker.process.current_step == 1
+    assert mesh_maker.process.compact() == 0
+
+
+def test_process_remove_steps_in_one_pass(mesh_maker):
+    for name in ("a", "b", "c", "d", "e"):
+        mesh_maker.process.add_step(mesh_maker.actions.tcl(f"puts {name}"), description=name)
+    mesh_maker.process.current_step = 3
+    steps = mesh_maker.process.get_steps()
+
+    assert mesh_maker.process.remove_steps([3, 0, 3, 9, -1]) == 2
+    assert mesh_maker.process.get_steps() is steps
+    assert [step.description for step in mesh_maker.process] == ["b", "c", "e"]
+    assert mesh_maker.process.current_step == 1
+    assert mesh_maker.process.remove_steps([]) == 0
@@ -247,3 +247,63 @@ def test_pile_vtkhdf_uses_default_response_types(mesh_maker):
     recorder = mesh_maker.recorder.pile_vtkhdf(["pile1"], file_base_name="piles")
 
     assert recorder.resp_types == ["disp", "vel", "accel", "force3D", "localForce3D"]
+
+
+def test_embedded_interface_recorder_defaults_to_all_response_types():
+    from femora.components.recorder.recorders import EmbeddedBeamSolidInterfaceRecorder
+
+    first = EmbeddedBeamSolidInterfaceRecorder(interface="pile_interface")
+    second = EmbeddedBeamSolidInterfaceRecorder(interface="pile_interface")
+    assert first.resp_type[0] == "displacement"
+    assert len(first.resp_type) == 13
+    assert first.resp_type == second.resp_type
+    assert first.resp_type is not second.resp_type
+
+    with pytest.raises(ValueError, match="Invalid response type"):
+        EmbeddedBeamSolidInterfaceRecorder(interface="pile_interface", resp_type="bogus")
+
+
+def test_recorders_use_slots_and_support_weakrefs(mesh_maker):
+    import weakref
+
+    rm = mesh_maker.recorder
+    recorders = [
+        rm.node(file_name="a.out", nodes=[1], dofs=[1], resp_type="disp"),
+        rm.drift(file_name="d.out", i_nodes=1, j_nodes=2, dof=1, perp_dirn=3),
+        rm.vtkhdf(file_base_name="results", resp_types=["disp"]),
+        rm.mpco(file_name="results.mpco"),
+        rm.beam_force(),
+        rm.embedded_beam_solid_interface(interface="pile_interface"),
+    ]
+    for recorder in recorders:
+        assert not hasattr(recorder, "__dict__")
+        assert weakref.ref(recorder)() is recorder
+        with pytest.raises(AttributeError):
+            recorder.undeclared_attribute = 1
+
+
+def test_node_recorder_caches_node_and_dof_strings(mesh_maker):
+    recorder = mesh_maker.recorder.node(file_name="n.out", nodes=[1, 2, 3], dofs=[1, 2], resp_type="disp")
+    assert recorder.to_tcl() == "recorder Node -file n.out -node 1 2 3 -dof 1 2 disp"
+
+    cached = recorder._nodes_tcl
+    recorder.to_tcl()
+    assert recorder._nodes_tcl is cached
+
+    recorder.nodes.append(4)
+    assert recorder.nodes == [1, 2, 3, 4]
+    recorder.dofs = [3]
+    assert recorder.to_tcl() == "recorder Node -file n.out -node 1 2 3 4 -dof 3 disp"
+
+
+def test_whole_model_recorders_insert_pid_before_last_extension(mesh_maker):
+    rm = mesh_maker.recorder
+    assert rm.vtkhdf(file_base_name="a.b.h5", resp_types=["disp"]).to_tcl() == "recorder vtkhdf a.b$pid.h5 disp"
+    assert rm.vtkhdf(file_base_name="./out/res", resp_types=["disp"]).to_tcl() == (
+        "recorder vtkhdf ./out/res$pid.vtkhdf disp"
+    )
+    assert rm.mpco(file_name="x.mpco.mpco").to_tcl() == 'recorder mpco "x.mpco$pid.mpco"'
+
+    recorder = rm.mpco(file_name="r.mpco")
+    recorder.file_name = "s"
+    assert recorder.to_tcl() == 'recorder mpco "s$pid"'